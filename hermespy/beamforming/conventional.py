@@ -7,16 +7,23 @@ Conventional Beamformer
 Also refererd to as Delay and Sum Beamformer.
 """
 
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import numpy as np
-from numba import jit
+from numba import jit, prange
 from scipy.constants import pi, speed_of_light
-
-from hermespy.core import AntennaArray, Direction, DuplexOperator, Serializable
+from scipy.linalg.blas import get_blas_funcs
+
+from hermespy.core import (
+    AntennaArray,
+    AntennaMode,
+    Direction,
+    DuplexOperator,
+    Precision,
+    Serializable,
+)
 from .beamformer import TransmitBeamformer, ReceiveBeamformer
 
-
 __author__ = "Jan Adler"
 __copyright__ = "Copyright 2023, Barkhausen Institut gGmbH"
 __credits__ = ["Jan Adler"]
@@ -61,10 +68,48 @@ class ConventionalBeamformer(Serializable, TransmitBeamformer, ReceiveBeamformer
     yaml_tag = "ConventionalBeamformer"
     """YAML serialization tag."""
 
-    def __init__(self, operator: Optional[DuplexOperator] = None) -> None:
+    __max_cached_codebooks = 2  # Maximum number of codebooks kept in memory
+    __codebook_cache: Dict[Tuple[float, bytes, bytes], np.ndarray]  # Recently computed codebooks
+    __precision: Precision  # Numerical precision of the beamforming weights
+
+    def __init__(
+        self, operator: Optional[DuplexOperator] = None, precision: Precision = Precision.DOUBLE
+    ) -> None:
+        """
+        Args:
+
+            operator (DuplexOperator, optional):
+                The operator this beamformer is attached to.
+
+            precision (Precision, optional):
+                Numerical precision of the beamforming weights and beamformed samples.
+                Double precision by default.
+        """
+
         TransmitBeamformer.__init__(self, operator=operator)
         ReceiveBeamformer.__init__(self, operator=operator)
 
+        # Initialize class attributes
+        self.__codebook_cache = {}
+        self.precision = precision
+
+    @property
+    def precision(self) -> Precision:
+        """Numerical precision of the beamforming weights and beamformed samples.
+
+        Single precision halves the memory footprint of codebooks and samples,
+        at the cost of a reduced numerical accuracy.
+        """
+
+        return self.__precision
+
+    @precision.setter
+    def precision(self, value: Precision) -> None:
+        self.__precision = value
+
+        # Cached codebooks are represented in the previous precision
+        self.__codebook_cache.clear()
+
     @property
     def num_receive_focus_points(self) -> int:
         # The conventional beamformer focuses a single angle
@@ -97,7 +142,69 @@ class ConventionalBeamformer(Serializable, TransmitBeamformer, ReceiveBeamformer
         # combining all antenna signals into one
         return 1
 
-    # @lru_cache(maxsize=2)
+    @staticmethod
+    def __phase_factors(phases: np.ndarray, dtype: type = np.complex_) -> np.ndarray:
+        """Convert real-valued phases to unit-magnitude complex factors.
+
+        Equivalent to :math:`e^{\\mathrm{j} \\varphi}`, but real and imaginary components are computed
+        directly into the complex output buffer, avoiding the temporary arrays of the complex exponential.
+
+        Args:
+
+            phases (numpy.ndarray):
+                Phases in radians.
+
+            dtype (type, optional):
+                Complex data type of the phase factors.
+
+        Returns: Complex phase factors of identical shape.
+        """
+
+        factors: np.ndarray = np.empty(phases.shape, dtype=dtype)
+        np.cos(phases, out=factors.real)
+        np.sin(phases, out=factors.imag)
+
+        return factors
+
+    @staticmethod
+    @jit(nopython=True, parallel=True)
+    def __steering_vectors(
+        topology: np.ndarray, angles: np.ndarray, wavenumber: float, scale: float, book: np.ndarray
+    ) -> None:  # pragma: no cover
+        """Compute far-field steering vectors towards multiple angles of interest.
+
+        Args:
+
+            topology (numpy.ndarray):
+                Cartesian antenna port positions as a :math:`3 \\times N` matrix,
+                i.e. with one contiguous row per coordinate axis.
+
+            angles (numpy.ndarray):
+                Azimuth and zenith angles of interest in radians as a :math:`M \\times 2` matrix.
+
+            wavenumber (float):
+                Wavenumber :math:`2\\pi f_\\mathrm{c} / c` of the assumed carrier.
+
+            scale (float):
+                Real-valued magnitude of each steering vector element.
+
+            book (numpy.ndarray):
+                :math:`M \\times N` complex matrix the steering vectors are written to.
+        """
+
+        num_angles = angles.shape[0]
+        num_ports = topology.shape[1]
+
+        for n in prange(num_angles):
+            zenith_sine = np.sin(angles[n, 1])
+            x = zenith_sine * np.cos(angles[n, 0])
+            y = zenith_sine * np.sin(angles[n, 0])
+            z = np.cos(angles[n, 1])
+
+            for m in range(num_ports):
+                phase = wavenumber * (topology[0, m] * x + topology[1, m] * y + topology[2, m] * z)
+                book[n, m] = complex(scale * np.cos(phase), scale * np.sin(phase))
+
     def _codebook(
         self, carrier_frequency: float, angles: np.ndarray, array: AntennaArray
     ) -> np.ndarray:
@@ -120,24 +227,37 @@ class ConventionalBeamformer(Serializable, TransmitBeamformer, ReceiveBeamformer
 
             The codebook represented by a two-dimensional numpy array,
             with the first dimension being the number of angles and the second dimension the number of antennas.
+            Codebooks are cached for identical parameters and must therefore not be modified.
         """
 
-        # Query topology of receiving antenna ports
-        topology = (
-            np.array([p.global_position for p in array.receive_ports], dtype=np.float_)
-            - array.global_position
+        # Query topology of receiving antenna ports, stored as one contiguous row per coordinate axis
+        topology = array.port_positions(AntennaMode.RX).T
+
+        # Return the cached codebook if it has been computed for identical parameters before
+        angles = np.ascontiguousarray(angles, dtype=np.float_)
+        cache_key = (carrier_frequency, angles.tobytes(), topology.tobytes())
+        cached_book = self.__codebook_cache.get(cache_key, None)
+        if cached_book is not None:
+            return cached_book
+
+        # Build receive beamforming codebook of steering vectors for all angles of interest at once,
+        # normalizing the steering vectors by the number of ports while filling the codebook
+        book = np.empty((angles.shape[0], topology.shape[1]), dtype=self.precision.complex_dtype)
+        self.__steering_vectors(
+            topology,
+            angles,
+            2 * pi * carrier_frequency / speed_of_light,
+            1 / array.num_receive_ports,
+            book,
         )
+        book.flags.writeable = False
 
-        # Build receive beamforming codebook of steering vectors for each angle of interest
-        book = np.empty((angles.shape[0], array.num_receive_ports), dtype=complex)
-        for n, (azimuth, zenith) in enumerate(angles):
-            direction = Direction.From_Spherical(azimuth, zenith)
-            weights = np.exp(
-                1j * 2 * pi * carrier_frequency / speed_of_light * (topology @ direction)
-            )
-            book[n, :] = weights
+        # Cache the codebook, discarding the oldest entry if the cache is full
+        if len(self.__codebook_cache) >= self.__max_cached_codebooks:
+            del self.__codebook_cache[next(iter(self.__codebook_cache))]
+        self.__codebook_cache[cache_key] = book
 
-        return book / array.num_receive_ports
+        return book
 
     def _encode(
         self,
@@ -149,34 +269,33 @@ class ConventionalBeamformer(Serializable, TransmitBeamformer, ReceiveBeamformer
         azimuth, zenith = focus_angles[0, :]
 
         # Compute conventional beamformer weights
-        topology = (
-            np.array([p.global_position for p in array.transmit_ports], dtype=np.float_)
-            - array.global_position
-        )
+        topology = array.port_positions(AntennaMode.TX).T
         direction = Direction.From_Spherical(azimuth, zenith)
-        weights = np.exp(-1j * 2 * pi * carrier_frequency / speed_of_light * (topology @ direction))
+        weights = self.__phase_factors(
+            (-2 * pi * carrier_frequency / speed_of_light) * (direction @ topology),
+            self.precision.complex_dtype,
+        )
 
-        # Weight the streams accordingly
-        samples = weights[:, np.newaxis] @ samples
+        # Weight the single input stream for each antenna port accordingly,
+        # which is an outer product and therefore computed by broadcasting instead of a matrix product
+        samples = weights[:, np.newaxis] * samples.astype(weights.dtype, copy=False)
 
         # That's it
         return samples
 
     @staticmethod
-    @jit(nopython=True)
-    def _beamform(
-        codebook: np.ndarray, samples: np.ndarray, conjugate: bool = False
-    ) -> np.ndarray:  # pragma: no cover
-        if conjugate:
-            return codebook.conj() @ samples
-
-        else:
-            return codebook @ samples
+    def _beamform(codebook: np.ndarray, samples: np.ndarray, conjugate: bool = False) -> np.ndarray:
+        # Transposed views of row-major matrices are column-major and passed to BLAS without copies,
+        # the codebook conjugation is applied inline by gemm's conjugate-transpose mode
+        gemm = get_blas_funcs("gemm", (codebook, samples))
+        return gemm(1.0, codebook.T, samples.T, trans_a=2 if conjugate else 1, trans_b=1)
 
     def _decode(
         self, samples: np.ndarray, carrier_frequency: float, angles: np.ndarray, array: AntennaArray
     ) -> np.ndarray:
         codebook = self._codebook(carrier_frequency, angles[:, 0, :], array)
-        beamformed_samples = self._beamform(codebook, samples, True)
+        beamformed_samples = self._beamform(
+            codebook, samples.astype(codebook.dtype, copy=False), True
+        )
 
         return beamformed_samples[:, np.newaxis, :]
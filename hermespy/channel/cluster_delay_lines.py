@@ -4,7 +4,7 @@ from __future__ import annotations
 from abc import abstractmethod
 from enum import Enum
 from functools import cached_property
-from math import ceil, sin, cos, sqrt
+from math import ceil, sqrt
 from typing import Any, Generator, Literal, List, Tuple, Type, TYPE_CHECKING
 
 import matplotlib.pyplot as plt
@@ -252,25 +252,39 @@ class ClusterDelayLineRealization(ChannelRealization, Visualizable):
             )
             delay: float = virtual_cluster_delays[subcluster_idx]
 
-            for aoa, zoa, aod, zod, jones in zip(
-                self.azimuth_of_arrival[cluster_idx, ray_indices],
-                self.zenith_of_arrival[cluster_idx, ray_indices],
-                self.azimuth_of_departure[cluster_idx, ray_indices],
-                self.zenith_of_departure[cluster_idx, ray_indices],
+            # Compute directive unit vectors of all rays within the subcluster
+            tx_directions = Direction.From_Spherical_batch(
+                np.stack(
+                    (
+                        self.azimuth_of_departure[cluster_idx, ray_indices],
+                        self.zenith_of_departure[cluster_idx, ray_indices],
+                    ),
+                    axis=1,
+                )
+            )
+            rx_directions = Direction.From_Spherical_batch(
+                np.stack(
+                    (
+                        self.azimuth_of_arrival[cluster_idx, ray_indices],
+                        self.zenith_of_arrival[cluster_idx, ray_indices],
+                    ),
+                    axis=1,
+                )
+            )
+
+            for tx_direction, rx_direction, jones in zip(
+                tx_directions,
+                rx_directions,
                 self.polarization_transformations[:, :, cluster_idx, ray_indices].transpose(
                     2, 0, 1
                 ),
             ):
-                # Compute directive unit vectors
-                tx_direction = Direction.From_Spherical(aod, zod)
-                rx_direction = Direction.From_Spherical(aoa, zoa)
-
                 # Combination of Equation 7.5-23, 7.5.24 and 7.5.28
                 tx_array_response = transmitter.antennas.cartesian_array_response(
-                    center_frequency, tx_direction.view(np.ndarray), "global", AntennaMode.TX
+                    center_frequency, tx_direction, "global", AntennaMode.TX
                 ).conj()
                 rx_array_response = receiver.antennas.cartesian_array_response(
-                    center_frequency, rx_direction.view(np.ndarray), "global", AntennaMode.RX
+                    center_frequency, rx_direction, "global", AntennaMode.RX
                 )
 
                 channel: np.ndarray = (
@@ -280,11 +294,9 @@ class ClusterDelayLineRealization(ChannelRealization, Visualizable):
                     * (sqrt(self.cluster_powers[cluster_idx] / self.num_clusters) * nlos_scale)
                 )
 
-                wave_vector = np.array(
-                    [cos(aoa) * sin(zoa), sin(aoa) * sin(zoa), cos(zoa)], dtype=float
-                )
+                # The arrival wave vector coincides with the receive direction
                 impulse: np.ndarray = np.exp(
-                    np.inner(wave_vector, relative_velocity) * fast_fading * 2j * pi
+                    np.inner(rx_direction, relative_velocity) * fast_fading * 2j * pi
                 )
 
                 yield channel, impulse, delay
@@ -7,6 +7,7 @@ from typing import Any, Sequence, Type, TYPE_CHECKING, List
 import matplotlib.pyplot as plt
 import numpy as np
 from h5py import Group
+from numba import jit, prange
 from numpy import cos, exp
 from scipy.constants import pi
 from sparse import GCXS  # type: ignore
@@ -385,6 +386,37 @@ class PathRealization(HDFSerializable):
 
         return self.__nlos_doppler
 
+    @staticmethod
+    @jit(nopython=True, parallel=True)
+    def __sum_sinusoids(
+        timestamps: np.ndarray, frequencies: np.ndarray, phases: np.ndarray
+    ) -> np.ndarray:  # pragma: no cover
+        """Sum up complex sinusoids sampled at multiple timestamps.
+
+        Args:
+
+            timestamps (numpy.ndarray): Timestamps in seconds at which to sample the sinusoids.
+            frequencies (numpy.ndarray): Angular frequency of each sinusoid.
+            phases (numpy.ndarray): Phase of each sinusoid in radians.
+
+        Returns: The sampled sum of all sinusoids.
+        """
+
+        num_sinusoids = frequencies.shape[0]
+        response = np.empty(timestamps.shape[0], dtype=np.complex128)
+
+        for t in prange(timestamps.shape[0]):
+            real = 0.0
+            imag = 0.0
+            for s in range(num_sinusoids):
+                argument = frequencies[s] * timestamps[t] + phases[s]
+                real += np.cos(argument)
+                imag += np.sin(argument)
+
+            response[t] = real + 1j * imag
+
+        return response
+
     def _impulse_response(self, timestamps: np.ndarray) -> np.ndarray:
         """Compute the impulse response of the represented multipath component.
 
@@ -397,18 +429,13 @@ class PathRealization(HDFSerializable):
 
         num_sinusoids = len(self.__nlos_angles)
 
-        # Initialize empty impulse response
-        impulse_response = np.zeros(len(timestamps), dtype=np.complex_)
-
         # Sum up and normalize all non-specular components
-        for s, (nlos_angle, nlos_phase) in enumerate(zip(self.nlos_angles, self.nlos_phases)):
-            impulse_response += exp(
-                1j
-                * (
-                    self.nlos_doppler * timestamps * cos((2 * pi * s + nlos_angle) / num_sinusoids)
-                    + nlos_phase
-                )
-            )
+        nlos_frequencies = self.nlos_doppler * cos(
+            (2 * pi * np.arange(num_sinusoids) + self.nlos_angles) / num_sinusoids
+        )
+        impulse_response = self.__sum_sinusoids(
+            np.asarray(timestamps, dtype=np.float_), nlos_frequencies, self.nlos_phases
+        )
         impulse_response *= self.nlos_gain * (num_sinusoids**-0.5)
 
         # Add the specular component
@@ -12,7 +12,7 @@ from .antennas import (
     CustomAntennaArray,
     UniformArray,
 )
-from .definitions import ConsoleMode, SNRType
+from .definitions import ConsoleMode, Precision, SNRType
 from .evaluators import (
     ReceivedPowerEvaluator,
     ReceivedPowerResult,
@@ -90,6 +90,7 @@ __all__ = [
     "AntennaArray",
     "CustomAntennaArray",
     "UniformArray",
+    "Precision",
     "SNRType",
     "ReceivedPowerEvaluator",
     "ReceivedPowerResult",
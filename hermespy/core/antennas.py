@@ -10,7 +10,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from copy import deepcopy
 from math import cos, sin, exp, sqrt
-from typing import Generic, List, Literal, overload, Tuple, Type, TypeVar
+from typing import Dict, Generic, List, Literal, overload, Tuple, Type, TypeVar
 
 import matplotlib.colors as colors
 import matplotlib.pyplot as plt
@@ -632,14 +632,16 @@ class AntennaPort(Generic[AT, AAT], Transformable, Serializable):
                 Antenna array this port belongs to.
         """
 
+        # Initialize class attributes
+        # The array reference is required by the kinematics callback during base class initialization
+        self.__array = None
+
         # Initialize base class
         Transformable.__init__(self, pose)
 
-        # Initialize class attributes
         self.__antennas = []
         self.__transmit_antennas = []
         self.__receive_antennas = []
-        self.__array = None
         self.array = array
 
         _antennas = [] if antennas is None else antennas
@@ -656,7 +658,7 @@ class AntennaPort(Generic[AT, AAT], Transformable, Serializable):
     def num_antennas(self) -> int:
         """Number of antenna elements connected to this port."""
 
-        return len(self.antennas)
+        return len(self.__antennas)
 
     def antennas_updated(self) -> None:
         """Callback that is called whenever the list of connected antennas is updated.
@@ -679,6 +681,10 @@ class AntennaPort(Generic[AT, AAT], Transformable, Serializable):
                 # This exception should never be raised
                 raise RuntimeError("Unknow antenna mode encountered")
 
+        # Notify the array that the port's transmit and receive capabilities might have changed
+        if self.__array is not None:
+            self.__array.ports_updated()
+
     def add_antenna(self, antenna: AT) -> None:
         """Add a new antenna to this port.
 
@@ -771,13 +777,26 @@ class AntennaPort(Generic[AT, AAT], Transformable, Serializable):
         if self.__array == value:
             return
 
+        # Notify the previous array that it lost this port
+        if self.__array is not None:
+            self.__array.ports_updated()
+
         self.__array = value
         self.set_base(self.__array)
 
+    def _kinematics_updated(self) -> None:
+        Transformable._kinematics_updated(self)
+
+        # Notify the array that the port's position might have changed
+        if self.__array is not None:
+            self.__array.ports_updated()
+
 
 class AntennaArray(ABC, Generic[APT, AT], Transformable):
     """Base class of a model of a set of antennas."""
 
+    __cached_port_positions: Dict[AntennaMode, np.ndarray]
+
     def __init__(self, pose: Transformation | None = None) -> None:
         """
         Args:
@@ -787,9 +806,71 @@ class AntennaArray(ABC, Generic[APT, AT], Transformable):
                 If not specified, the same orientation and position as the device is assumed.
         """
 
+        # Initialize class attributes
+        # The cache is required by the kinematics callback during base class initialization
+        self.__cached_port_positions = {}
+
         # Initialize base class
         Transformable.__init__(self, pose=pose)
 
+    def ports_updated(self) -> None:
+        """Notify the antenna array that its ports have been modified.
+
+        Automatically called whenever ports are added to or removed from the array,
+        or if a port's position or antennas change.
+        """
+
+        self.__cached_port_positions.clear()
+
+    def _kinematics_updated(self) -> None:
+        self.ports_updated()
+        Transformable._kinematics_updated(self)
+
+    def port_positions(self, mode: AntennaMode = AntennaMode.DUPLEX) -> np.ndarray:
+        """Global positions of antenna ports of a certain mode relative to the array's global position.
+
+        The positions are cached until the array's ports or kinematics change.
+
+        Args:
+
+            mode (AntennaMode, optional):
+                Antenna mode of interest.
+                `DUPLEX` by default, meaning that all antenna ports are considered.
+
+        Returns:
+
+            Read-only :math:`M \\times 3` position matrix, where :math:`M` is the number of ports.
+            Stored in column-major order, so that each cartesian axis is contiguous in memory.
+
+        Raises:
+
+            ValueError: If an unknown antenna mode is encountered.
+        """
+
+        positions = self.__cached_port_positions.get(mode, None)
+        if positions is not None:
+            return positions
+
+        ports: Sequence[APT]
+        if mode == AntennaMode.DUPLEX:
+            ports = self.ports
+
+        elif mode == AntennaMode.TX:
+            ports = self.transmit_ports
+
+        elif mode == AntennaMode.RX:
+            ports = self.receive_ports
+
+        else:
+            raise ValueError("Unknown antenna mode encountered")
+
+        global_positions = np.array([p.global_position for p in ports], dtype=np.float_)
+        positions = np.asfortranarray(global_positions.reshape((-1, 3)) - self.global_position)
+        positions.flags.writeable = False
+
+        self.__cached_port_positions[mode] = positions
+        return positions
+
     @property
     def num_ports(self) -> int:
         """Number of antenna ports within this array."""
@@ -869,9 +950,12 @@ class AntennaArray(ABC, Generic[APT, AT], Transformable):
             IndexError: If an invalid port index is encountered.
         """
 
+        # Query the port sequence only once, since it may be regenerated on each access
+        array_ports = self.ports
+
         num_antennas = 0
         for port_index in ports:
-            num_antennas += self.ports[port_index].num_antennas
+            num_antennas += array_ports[port_index].num_antennas
 
         return num_antennas
 
@@ -890,9 +974,12 @@ class AntennaArray(ABC, Generic[APT, AT], Transformable):
             IndexError: If an invalid port index is encountered.
         """
 
+        # Query the port sequence only once, since it may be regenerated on each access
+        array_ports = self.transmit_ports
+
         num_antennas = 0
         for port_index in ports:
-            num_antennas += self.transmit_ports[port_index].num_transmit_antennas
+            num_antennas += array_ports[port_index].num_transmit_antennas
 
         return num_antennas
 
@@ -911,9 +998,12 @@ class AntennaArray(ABC, Generic[APT, AT], Transformable):
             IndexError: If an invalid port index is encountered.
         """
 
+        # Query the port sequence only once, since it may be regenerated on each access
+        array_ports = self.receive_ports
+
         num_antennas = 0
         for port_index in ports:
-            num_antennas += self.receive_ports[port_index].num_receive_antennas
+            num_antennas += array_ports[port_index].num_receive_antennas
 
         return num_antennas
 
@@ -1520,12 +1610,11 @@ class UniformArray(Generic[APT, AT], AntennaArray[APT, AT], Serializable):
     def __update_ports(self) -> None:
         """Update ports if the toplogy configuration has changed in any way."""
 
-        grid = np.meshgrid(
-            np.arange(self.__dimensions[0]),
-            np.arange(self.__dimensions[1]),
-            np.arange(self.__dimensions[2]),
-        )
-        positions = self.__spacing * np.vstack((grid[0].flat, grid[1].flat, grid[2].flat)).T
+        # Grid indices in the same order as an xy-indexed meshgrid, i.e. y-major
+        grid = np.indices(
+            (self.__dimensions[1], self.__dimensions[0], self.__dimensions[2])
+        ).reshape((3, -1))
+        positions = self.__spacing * grid[[1, 0, 2], :].T
 
         self.__ports = [deepcopy(self.__base_port) for _ in range(self.num_antennas)]
         self.__antennas: List[AT] = []
@@ -1537,11 +1626,14 @@ class UniformArray(Generic[APT, AT], AntennaArray[APT, AT], Serializable):
         for port, pos in zip(self.__ports, positions):
             # Update the port transformation
             port.position = pos
-            port.set_base(self)
+            port.array = self
 
             # Update the internal antenna lists
             self.__antennas.extend(port.antennas)
 
+        # Discard positions cached for the replaced ports
+        self.ports_updated()
+
     @property
     def spacing(self) -> float:
         """Spacing between the antenna elements.
@@ -442,7 +442,7 @@ class ChannelStateInformation(HDFSerializable):
         for sample_idx in range(self.num_samples):
             yield ChannelStateInformation(
                 self.__state_format,
-                self.__state[:, :, [sample_idx], :],
+                self.__state[:, :, sample_idx : sample_idx + 1, :],
                 self.__num_delay_taps,
                 self.__num_frequency_bins,
             )
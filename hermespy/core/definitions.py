@@ -5,6 +5,10 @@ General Definitions
 ===================
 """
 
+from typing import Type
+
+import numpy as np
+
 from .factory import SerializableEnum
 
 __author__ = "Jan Adler"
@@ -50,3 +54,19 @@ class SNRType(SerializableEnum):
 
     CUSTOM = 3
     """Custom snr definition."""
+
+
+class Precision(SerializableEnum):
+    """Floating point precision of numerical signal processing routines."""
+
+    SINGLE = 0
+    """Single precision, i.e. 32-bit real and 64-bit complex numbers."""
+
+    DOUBLE = 1
+    """Double precision, i.e. 64-bit real and 128-bit complex numbers."""
+
+    @property
+    def complex_dtype(self) -> Type[np.complexfloating]:
+        """Numpy data type of complex numbers represented in this precision."""
+
+        return np.complex64 if self == Precision.SINGLE else np.complex128
@@ -524,11 +524,12 @@ class Factory:
 
         # Transform complex numpy arrays to their string representation
         if array.dtype in [np.complex64, np.complex128]:
-            object_array = np.empty(array.shape, dtype=object)
-            for index, number in np.ndenumerate(array):
-                object_array[index] = str(number).replace("(", "").replace(")", "")
+            object_array = np.empty(array.size, dtype=object)
+            object_array[:] = [
+                str(number).replace("(", "").replace(")", "") for number in array.flat
+            ]
 
-            list = object_array.tolist()
+            list = object_array.reshape(array.shape).tolist()
 
         else:
             list = array.tolist()
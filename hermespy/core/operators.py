@@ -96,11 +96,16 @@ class SilentTransmitter(StaticOperator, Transmitter[Transmission]):
         # Compute the number of samples to be transmitted
         num_samples = self.num_samples if duration <= 0.0 else int(duration * self.sampling_rate)
 
-        silence = Signal(
-            np.zeros((self.device.num_antennas, num_samples), dtype=complex),
-            sampling_rate=self.sampling_rate,
+        # Assign the silent samples directly instead of passing them to the signal's initialization,
+        # which would copy the zero-initialized buffer.
+        # Silent buffers are not shared across transmissions, since transmitted samples may be
+        # modified in-place downstream, for example by antenna weights or phase noise
+        silence = Signal.empty(
+            self.sampling_rate,
+            self.device.num_antennas,
             carrier_frequency=self.device.carrier_frequency,
         )
+        silence.samples = np.zeros((self.device.num_antennas, num_samples), dtype=complex)
 
         transmission = Transmission(silence)
 
@@ -67,6 +67,25 @@ class Direction(np.ndarray):
         direction = cls.__from_spherical(np.array([azimuth, zenith], dtype=float)).view(cls)
         return direction
 
+    @staticmethod
+    def From_Spherical_batch(angles: np.ndarray) -> np.ndarray:
+        """Generate multiple cartesian unit vectors from spherical coordinates.
+
+        Args:
+
+            angles (np.ndarray):
+                Matrix of dimensions :math:`N \\times 2` containing azimuth and zenith angles in radians.
+
+        Returns: Matrix of dimensions :math:`N \\times 3` containing a unit vector in each row.
+        """
+
+        cos = np.cos(angles)
+        sin = np.sin(angles)
+
+        return np.stack((sin[:, 1] * cos[:, 0], sin[:, 1] * sin[:, 0], cos[:, 1]), axis=1).astype(
+            np.float_, copy=False
+        )
+
     @jit(nopython=True)
     def __to_spherical(unit_vector: np.ndarray) -> np.ndarray:  # pragma: no cover
         """Transform a unit vector to spherical coordinates.
@@ -87,6 +87,14 @@ class BlockInterleaver(Encoder, Serializable):
     def encode(self, bits: np.ndarray) -> np.ndarray:
         return bits.reshape((self.interleave_blocks, -1)).T.flatten()
 
+    def encode_blocks(self, bits: np.ndarray) -> np.ndarray:
+        num_blocks = bits.shape[0]
+        return (
+            bits.reshape((num_blocks, self.interleave_blocks, -1))
+            .transpose((0, 2, 1))
+            .reshape((num_blocks, -1))
+        )
+
     def decode(self, encoded_bits: np.ndarray) -> np.ndarray:
         return encoded_bits.reshape((-1, self.interleave_blocks)).T.flatten()
 
@@ -170,6 +170,29 @@ class Encoder(ABC, Serializable):
         """
         ...  # pragma: no cover
 
+    def encode_blocks(self, bits: np.ndarray) -> np.ndarray:
+        """Encodes a batch of bit blocks.
+
+        By default, each block is encoded by a separate call to :meth:`.encode`.
+        Encoders able to process multiple blocks at once may override this routine.
+
+        Args:
+
+            bits (np.ndarray):
+                A numpy matrix of dimension :math:`B \\times K_n`, representing :math:`B` bit blocks to be encoded.
+
+        Returns:
+
+            np.ndarray:
+                A numpy matrix of dimension :math:`B \\times L_n`, representing :math:`B` code blocks.
+        """
+
+        code = np.empty((bits.shape[0], self.code_block_size), dtype=bits.dtype)
+        for block_idx, block in enumerate(bits):
+            code[block_idx, :] = self.encode(block)
+
+        return code
+
     @abstractmethod
     def decode(self, encoded_bits: np.ndarray) -> np.ndarray:
         """Decodes a single block of bits.
@@ -444,14 +467,10 @@ class EncoderManager(RandomNode, Serializable):
                     data_state, self._rng.integers(0, 2, num_padding_bits, dtype=bool)
                 )
 
-            # Encode all blocks sequentially
-            for block_idx in range(num_blocks):
-                encoded_block = encoder.encode(
-                    data_state[block_idx * data_block_size : (1 + block_idx) * data_block_size]
-                )
-                code_state[
-                    block_idx * code_block_size : (1 + block_idx) * code_block_size
-                ] = encoded_block
+            # Encode all blocks as a single batch
+            code_state.reshape((num_blocks, code_block_size))[:] = encoder.encode_blocks(
+                data_state.reshape((num_blocks, data_block_size))
+            )
 
         if num_code_bits and len(code_state) > num_code_bits:
             raise RuntimeError(
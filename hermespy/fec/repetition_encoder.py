@@ -85,6 +85,9 @@ class RepetitionEncoder(Encoder, Serializable):
         code = np.tile(bits, self.repetitions)
         return code
 
+    def encode_blocks(self, bits: np.ndarray) -> np.ndarray:
+        return np.tile(bits, (1, self.repetitions))
+
     def decode(self, encoded_bits: np.ndarray) -> np.ndarray:
         if self.repetitions == 1:
             return encoded_bits
@@ -162,6 +162,11 @@ class Scrambler3GPP(Encoder, Serializable):
 
         return code
 
+    def encode_blocks(self, bits: np.ndarray) -> np.ndarray:
+        # The scrambling sequence continues across blocks, so all blocks may share a single draw
+        codeword = self.__transmit_rng.generate_sequence(bits.size).reshape(bits.shape)
+        return (bits + codeword) % 2
+
     def decode(self, code: np.ndarray) -> np.ndarray:
         codeword = self.__receive_rng.generate_sequence(code.shape[0])
         data = (code + codeword) % 2
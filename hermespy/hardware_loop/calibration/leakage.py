@@ -361,7 +361,8 @@ class SelectiveLeakageCalibration(LeakageCalibrationBase, Visualizable, Serializ
         s_select = s[:num_samples]
         vh_select = vh[:num_samples, :]
 
-        mmse_estimator = h.T.conj() @ vh_select.T.conj() @ np.diag(1 / s_select) @ u_select.T.conj()
+        # Right-multiplying a diagonal matrix scales columns, which avoids materializing the diagonal
+        mmse_estimator = ((h.T.conj() @ vh_select.T.conj()) / s_select) @ u_select.T.conj()
 
         # Estimate the frequency spectra for each antenna probing independently
         mmse_frequency_selectivity_estimation = np.zeros(
@@ -6,14 +6,14 @@ Matched Filter JCAS
 """
 
 from __future__ import annotations
-from typing import Optional, Type
+from typing import Optional, Tuple, Type
 
 import numpy as np
 from h5py import Group
 from scipy.constants import speed_of_light
-from scipy.signal import correlate, correlation_lags
+from scipy.fft import fft, ifft, next_fast_len
 
-from hermespy.core import Device, Receiver, SNRType, Signal, Serializable, Transmitter
+from hermespy.core import Device, Precision, Receiver, SNRType, Signal, Serializable, Transmitter
 from hermespy.modem import DuplexModem, CommunicationTransmission, CommunicationReception
 from hermespy.radar import Radar, RadarTransmission, RadarReception, RadarCube
 
@@ -77,13 +77,31 @@ class MatchedFilterJcas(  # type: ignore[misc]
     # The specific required sampling rate
     __sampling_rate: Optional[float]
     __max_range: float  # Maximally detectable range
-
-    def __init__(self, max_range: float, device: Device | None = None, **kwargs) -> None:
+    __precision: Precision  # Numerical precision of the correlation
+    __transmission_spectrum: Optional[Tuple[RadarTransmission, int, np.ndarray]]
+    __range_bins: Optional[Tuple[int, float, np.ndarray]]
+    __angle_bins: np.ndarray
+    __velocity_bins: np.ndarray
+
+    def __init__(
+        self,
+        max_range: float,
+        device: Device | None = None,
+        precision: Precision = Precision.DOUBLE,
+        **kwargs,
+    ) -> None:
         """
         Args:
 
             max_range (float):
                 Maximally detectable range in m.
+
+            device (Device, optional):
+                Device this operator is assigned to.
+
+            precision (Precision, optional):
+                Numerical precision of the matched filter correlation.
+                Double precision by default.
         """
 
         # Initialize base classes
@@ -92,6 +110,13 @@ class MatchedFilterJcas(  # type: ignore[misc]
 
         # Initialize class attributes
         self.__sampling_rate = None
+        self.__transmission_spectrum = None
+        self.__range_bins = None
+        self.__angle_bins = np.array([[0.0, 0.0]])
+        self.__angle_bins.flags.writeable = False
+        self.__velocity_bins = np.array([0.0])
+        self.__velocity_bins.flags.writeable = False
+        self.precision = precision
         self.max_range = max_range
         self.device = device
 
@@ -100,6 +125,40 @@ class MatchedFilterJcas(  # type: ignore[misc]
         transmission = JCASTransmission(DuplexModem._transmit(self, duration))  # type: ignore
         return transmission
 
+    def _matched_filter_spectrum(self, num_samples: int) -> np.ndarray:
+        """Frequency-domain matched filter of the most recent transmission.
+
+        The spectrum is cached until either the transmission or the transform length changes.
+
+        Args:
+
+            num_samples (int):
+                Number of samples of the discrete Fourier transform.
+
+        Returns: Complex conjugate of the transmitted signal's spectrum.
+        """
+
+        transmission = self.transmission
+        dtype = self.precision.complex_dtype
+
+        if (
+            self.__transmission_spectrum is None
+            or self.__transmission_spectrum[0] is not transmission
+            or self.__transmission_spectrum[1] != num_samples
+            or self.__transmission_spectrum[2].dtype != dtype
+        ):
+            spectrum = np.conj(
+                fft(
+                    transmission.signal.samples.astype(dtype, copy=False),
+                    num_samples,
+                    axis=1,
+                    workers=-1,
+                )
+            )
+            self.__transmission_spectrum = (transmission, num_samples, spectrum)
+
+        return self.__transmission_spectrum[2]
+
     def _receive(self, signal: Signal) -> JCASReception:
         # There must be a recent transmission being cached in order to correlate
         if self.transmission is None:
@@ -110,52 +169,85 @@ class MatchedFilterJcas(  # type: ignore[misc]
         # Receive information
         communication_reception = DuplexModem._receive(self, signal)
 
-        # Re-sample communication waveform
-        signal = signal.resample(self.sampling_rate)
+        # Re-sample communication waveform only if required, since resampling always copies samples
+        if signal.sampling_rate != self.sampling_rate:
+            signal = signal.resample(self.sampling_rate)
 
         resolution = self.range_resolution
         num_propagated_samples = int(2 * self.max_range / resolution)
 
         # Append additional samples if the signal is too short
+        # The received signal might not have been copied, so it must not be modified in-place
         required_num_received_samples = (
             self.transmission.signal.num_samples + num_propagated_samples
         )
         if signal.num_samples < required_num_received_samples:
-            signal.append_samples(
-                Signal(
-                    np.zeros(
-                        (1, required_num_received_samples - signal.num_samples), dtype=complex
-                    ),
-                    self.sampling_rate,
-                    signal.carrier_frequency,
-                )
+            padded_samples = np.zeros(
+                (signal.num_streams, required_num_received_samples), dtype=np.complex_
+            )
+            padded_samples[:, : signal.num_samples] = signal.samples
+            signal = Signal(
+                padded_samples,
+                self.sampling_rate,
+                signal.carrier_frequency,
+                signal.delay,
+                signal.noise_power,
             )
 
         # Remove possible overhead samples if signal is too long
         # resampled_signal.samples = re
         # sampled_signal.samples[:, :num_samples]
 
-        correlation = (
-            abs(
-                correlate(
-                    signal.samples, self.transmission.signal.samples, mode="valid", method="fft"
-                ).flatten()
-            )
-            / self.transmission.signal.num_samples
-        )
-        lags = correlation_lags(
-            signal.num_samples, self.transmission.signal.num_samples, mode="valid"
+        # Correlate the received samples with the transmitted samples in frequency domain
+        # Transform lengths of at least the number of received samples avoid cyclic wrap-arounds
+        # within the valid correlation lags, fast lengths keep pocketfft's cached plans efficient
+        num_fft_samples = next_fast_len(signal.num_samples)
+        transmitted_streams = self.transmission.signal.samples.shape[0]
+        matched_filter_spectrum = self._matched_filter_spectrum(num_fft_samples)
+
+        # Single-stream correlations operate on flat views of the sample buffers,
+        # multi-stream correlations are superimposed over all streams
+        if transmitted_streams == 1:
+            received_samples = signal.samples[0, :]
+            matched_filter_spectrum = matched_filter_spectrum[0, :]
+
+        else:
+            received_samples = signal.samples[:transmitted_streams, :]
+
+        spectrum = fft(
+            received_samples.astype(self.precision.complex_dtype, copy=False),
+            num_fft_samples,
+            axis=-1,
+            workers=-1,
         )
+        spectrum *= matched_filter_spectrum
+
+        correlation_spectrum = spectrum if spectrum.ndim == 1 else spectrum.sum(axis=0)
+        correlation = ifft(correlation_spectrum, workers=-1, overwrite_x=True)
 
         # Append zeros for correct depth estimation
         # num_appended_zeros = max(0, num_samples - resampled_signal.num_samples)
         # correlation = np.append(correlation, np.zeros(num_appended_zeros))
 
-        # Create the cube object
-        angle_bins = np.array([[0.0, 0.0]])
-        velocity_bins = np.array([0.0])
-        range_bins = 0.5 * lags[:num_propagated_samples] * resolution
-        cube_data = np.array([[correlation[:num_propagated_samples]]], dtype=float)
+        # Create the cube object,
+        # its bins only depend on the cube dimensions and are shared among consecutive receptions
+        if (
+            self.__range_bins is None
+            or self.__range_bins[0] != num_propagated_samples
+            or self.__range_bins[1] != resolution
+        ):
+            range_bins = 0.5 * resolution * np.arange(num_propagated_samples, dtype=np.float_)
+            range_bins.flags.writeable = False
+            self.__range_bins = (num_propagated_samples, resolution, range_bins)
+
+        angle_bins = self.__angle_bins
+        velocity_bins = self.__velocity_bins
+        range_bins = self.__range_bins[2]
+
+        # Write the normalized correlation magnitudes directly into the cube's data buffer
+        cube_data = np.empty((1, 1, num_propagated_samples), dtype=np.float_)
+        np.abs(correlation[:num_propagated_samples], out=cube_data[0, 0, :])
+        cube_data *= 1 / self.transmission.signal.num_samples
         cube = RadarCube(cube_data, angle_bins, velocity_bins, range_bins, self.carrier_frequency)
 
         # Infer the point cloud, if a detector has been configured
@@ -185,6 +277,20 @@ class MatchedFilterJcas(  # type: ignore[misc]
 
         self.__sampling_rate = value
 
+    @property
+    def precision(self) -> Precision:
+        """Numerical precision of the matched filter correlation.
+
+        Single precision halves the memory footprint of the correlated spectra,
+        at the cost of a reduced numerical accuracy of the estimated radar cube.
+        """
+
+        return self.__precision
+
+    @precision.setter
+    def precision(self, value: Precision) -> None:
+        self.__precision = value
+
     @property
     def range_resolution(self) -> float:
         """Resolution of the Range Estimation.
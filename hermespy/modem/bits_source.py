@@ -66,7 +66,9 @@ class RandomBitsSource(BitsSource, Serializable):
         BitsSource.__init__(self, seed=seed)
 
     def generate_bits(self, num_bits: int) -> np.ndarray:
-        return self._rng.integers(0, 2, size=num_bits, dtype=int)
+        # Draw eight bits per random byte instead of a full random integer per bit
+        packed_bits = np.frombuffer(self._rng.bytes(-(-num_bits // 8)), dtype=np.uint8)
+        return np.unpackbits(packed_bits, count=num_bits)
 
 
 class StreamBitsSource(BitsSource, Serializable):
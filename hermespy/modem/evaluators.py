@@ -29,6 +29,68 @@ __email__ = "jan.adler@barkhauseninstitut.org"
 __status__ = "Prototype"
 
 
+def _error_rate(error_indicators: np.ndarray) -> np.float_:
+    """Compute the rate of errors within a sequence of error indicators.
+
+    Counting the non-zero indicators avoids the floating point accumulation of :func:`numpy.mean`.
+
+    Args:
+
+        error_indicators (np.ndarray):
+            Error indicators in 0/1 format.
+
+    Returns: The ratio of errors to indicators, NaN for empty sequences.
+    """
+
+    return np.divide(np.count_nonzero(error_indicators), np.float_(error_indicators.size))
+
+
+def _block_errors(
+    transmitted_bits: np.ndarray, received_bits: np.ndarray, block_size: int
+) -> np.ndarray:
+    """Compute block error indicators of received bits partitioned into blocks.
+
+    The received bits are zero-padded to an integer multiple of the block size.
+    Received bits without a transmitted counterpart are always considered erroneous.
+    Shared by all evaluators reducing bit errors to block-wise indicators,
+    so that each evaluation requires only a single pass over the bit sequences.
+
+    Args:
+
+        transmitted_bits (np.ndarray):
+            Transmitted bits in 0/1 format.
+
+        received_bits (np.ndarray):
+            Received bits in 0/1 format.
+
+        block_size (int):
+            Number of bits per block.
+
+    Returns: Boolean error indicator for each block.
+    """
+
+    num_received_bits = len(received_bits)
+    num_bits = num_received_bits + (-num_received_bits) % block_size
+    num_compared_bits = min(len(transmitted_bits), num_bits)
+
+    # Without any transmitted bits to compare against, all received blocks are erroneous
+    if num_compared_bits < 1:
+        return np.ones(num_bits // block_size, dtype=np.bool_)
+
+    padded_reception = np.zeros(num_bits, dtype=np.uint8)
+    padded_reception[:num_received_bits] = received_bits
+
+    bit_errors = np.ones(num_bits, dtype=np.uint8)
+    np.bitwise_xor(
+        np.asarray(transmitted_bits[:num_compared_bits], dtype=np.uint8),
+        padded_reception[:num_compared_bits],
+        out=bit_errors[:num_compared_bits],
+    )
+
+    # A block is erroneous if any of its bits differ
+    return bit_errors.reshape((-1, block_size)).any(axis=1)
+
+
 class CommunicationEvaluator(Evaluator, ABC):
     """Base class for evaluating communication processes between two modems."""
 
@@ -92,6 +154,7 @@ class BitErrorArtifact(ArtifactTemplate[np.float_]):
 
     Generated by :meth:`artifact()<BitErrorEvaluation.artifact>` of :class:`BitErrorEvaluation`.
     """
+
     ...  # pragma: no cover
 
 
@@ -112,7 +175,7 @@ class BitErrorEvaluation(EvaluationTemplate[np.ndarray]):
         ax.set_ylabel("Bit Error Indicator")
 
     def artifact(self) -> BitErrorArtifact:
-        ber = np.mean(self.evaluation)
+        ber = _error_rate(self.evaluation)
         return BitErrorArtifact(ber)
 
 
@@ -149,16 +212,22 @@ class BitErrorEvaluator(CommunicationEvaluator, Serializable):
         transmitted_bits = self.transmitting_modem.transmission.bits
         received_bits = self.receiving_modem.reception.bits
 
+        # If either sequence is empty, the bit errors are the remaining sequence's non-zero bits
+        if len(transmitted_bits) < 1 or len(received_bits) < 1:
+            remaining_bits = received_bits if len(transmitted_bits) < 1 else transmitted_bits
+            return BitErrorEvaluation(np.array(remaining_bits, dtype=np.uint8))
+
         # Pad bit sequences (if required)
         num_bits = max(len(received_bits), len(transmitted_bits))
-        padded_transmission = np.append(
-            transmitted_bits, np.zeros(num_bits - len(transmitted_bits))
-        )
-        padded_reception = np.append(received_bits, np.zeros(num_bits - len(received_bits)))
+        padded_transmission = np.zeros(num_bits, dtype=np.uint8)
+        padded_transmission[: len(transmitted_bits)] = transmitted_bits
+        padded_reception = np.zeros(num_bits, dtype=np.uint8)
+        padded_reception[: len(received_bits)] = received_bits
 
         # Compute bit errors as the positions where both sequences differ.
         # Note that this requires the sequences to be in 0/1 format!
-        bit_errors = np.abs(padded_transmission - padded_reception)
+        # The padded transmission buffer is reused to store the bit errors.
+        bit_errors = np.bitwise_xor(padded_transmission, padded_reception, out=padded_transmission)
 
         return BitErrorEvaluation(bit_errors)
 
@@ -195,7 +264,7 @@ class BlockErrorEvaluation(EvaluationTemplate[np.ndarray]):
         ax.set_ylabel("Block Error Indicator")
 
     def artifact(self) -> BlockErrorArtifact:
-        bler = np.mean(self.evaluation)
+        bler = _error_rate(self.evaluation)
         return BlockErrorArtifact(bler)
 
 
@@ -233,21 +302,8 @@ class BlockErrorEvaluator(CommunicationEvaluator, Serializable):
         received_bits = self.receiving_modem.reception.bits
         block_size = self.receiving_modem.encoder_manager.bit_block_size
 
-        # Pad bit sequences (if required)
-        received_bits = np.append(received_bits, np.zeros(received_bits.shape[0] % block_size))
-
-        if transmitted_bits.shape[0] >= received_bits.shape[0]:
-            transmitted_bits = transmitted_bits[: received_bits.shape[0]]
-
-        else:
-            transmitted_bits = np.append(
-                transmitted_bits, -np.ones(received_bits.shape[0] - transmitted_bits.shape[0])
-            )
-
-        # Compute bit errors as the positions where both sequences differ.
-        # Note that this requires the sequences to be in 0/1 format!
-        bit_errors = np.abs(transmitted_bits - received_bits)
-        block_errors = bit_errors.reshape((-1, block_size)).sum(axis=1) > 0
+        # Compute block errors as the blocks where both sequences differ
+        block_errors = _block_errors(transmitted_bits, received_bits, block_size)
 
         return BlockErrorEvaluation(block_errors)
 
@@ -284,7 +340,7 @@ class FrameErrorEvaluation(EvaluationTemplate[np.ndarray]):
         ax.set_ylabel("Frame Error Indicator")
 
     def artifact(self) -> FrameErrorArtifact:
-        bler = float(np.mean(self.evaluation))
+        bler = float(_error_rate(self.evaluation))
         return FrameErrorArtifact(bler)
 
 
@@ -326,21 +382,8 @@ class FrameErrorEvaluator(CommunicationEvaluator, Serializable):
         if frame_size < 1:
             return FrameErrorEvaluation(np.empty(0, dtype=np.int_))
 
-        # Pad bit sequences (if required)
-        received_bits = np.append(received_bits, np.zeros(received_bits.shape[0] % frame_size))
-
-        if transmitted_bits.shape[0] >= received_bits.shape[0]:
-            transmitted_bits = transmitted_bits[: received_bits.shape[0]]
-
-        else:
-            transmitted_bits = np.append(
-                transmitted_bits, -np.ones(received_bits.shape[0] - transmitted_bits.shape[0])
-            )
-
-        # Compute bit errors as the positions where both sequences differ.
-        # Note that this requires the sequences to be in 0/1 format!
-        bit_errors = np.abs(transmitted_bits - received_bits)
-        frame_errors = bit_errors.reshape((-1, frame_size)).sum(axis=1) > 0
+        # Compute frame errors as the frames where both sequences differ
+        frame_errors = _block_errors(transmitted_bits, received_bits, frame_size)
 
         return FrameErrorEvaluation(frame_errors)
 
@@ -383,7 +426,7 @@ class ThroughputEvaluation(EvaluationTemplate[float]):
         """
 
         num_frames = len(frame_errors)
-        num_correct_frames = np.sum(np.invert(frame_errors))
+        num_correct_frames = num_frames - np.count_nonzero(frame_errors)
 
         throughput = num_correct_frames * bits_per_frame / (num_frames * frame_duration)
         EvaluationTemplate.__init__(self, throughput)
@@ -402,8 +445,6 @@ class ThroughputEvaluator(CommunicationEvaluator, Serializable):
     yaml_tag = "ThroughputEvaluator"
     """YAML serialization tag"""
 
-    __framer_error_evaluator: FrameErrorEvaluator
-
     def __init__(
         self,
         transmitting_modem: TransmittingModem,
@@ -427,15 +468,20 @@ class ThroughputEvaluator(CommunicationEvaluator, Serializable):
         # Initialize base class
         CommunicationEvaluator.__init__(self, transmitting_modem, receiving_modem, plot_surface)
 
-        # Initialize class attributes
-        self.__framer_error_evaluator = FrameErrorEvaluator(transmitting_modem, receiving_modem)
-
     def evaluate(self) -> ThroughputEvaluation:
-        # Get the frame errors
-        frame_errors = self.__framer_error_evaluator.evaluate().evaluation.flatten()
+        # Retrieve transmitted and received bits
+        transmitted_bits = self.transmitting_modem.transmission.bits
+        received_bits = self.receiving_modem.reception.bits
+        bits_per_frame = self.receiving_modem.num_data_bits_per_frame
+
+        # Get the frame errors directly, without an intermediate frame error evaluation
+        frame_errors = (
+            np.empty(0, dtype=np.bool_)
+            if bits_per_frame < 1
+            else _block_errors(transmitted_bits, received_bits, bits_per_frame)
+        )
 
         # Transform frame errors to data throughput
-        bits_per_frame = self.receiving_modem.num_data_bits_per_frame
         frame_duration = self.receiving_modem.frame_duration
 
         return ThroughputEvaluation(bits_per_frame, frame_duration, frame_errors)
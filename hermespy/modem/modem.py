@@ -189,11 +189,9 @@ class CommunicationTransmission(Transmission):
         Returns: Numpy array of transmitted bits.
         """
 
-        concatenated_bits = np.empty(0, dtype=np.uint8)
-        for frame in self.frames:
-            concatenated_bits = np.append(concatenated_bits, frame.bits)
-
-        return concatenated_bits
+        return np.concatenate(
+            [np.empty(0, dtype=np.uint8)] + [frame.bits for frame in self.frames]
+        )
 
     @cached_property
     def symbols(self) -> Symbols:
@@ -371,11 +369,9 @@ class CommunicationReception(Reception):
             Numpy array containing received bits.
         """
 
-        concatenated_bits = np.empty(0, dtype=np.uint8)
-        for frame in self.frames:
-            concatenated_bits = np.append(concatenated_bits, frame.encoded_bits)
-
-        return concatenated_bits
+        return np.concatenate(
+            [np.empty(0, dtype=np.uint8)] + [frame.encoded_bits for frame in self.frames]
+        )
 
     @cached_property
     def bits(self) -> np.ndarray:
@@ -386,11 +382,9 @@ class CommunicationReception(Reception):
             Numpy array containing received bits.
         """
 
-        concatenated_bits = np.empty(0, dtype=np.uint8)
-        for frame in self.frames:
-            concatenated_bits = np.append(concatenated_bits, frame.decoded_bits)
-
-        return concatenated_bits
+        return np.concatenate(
+            [np.empty(0, dtype=np.uint8)] + [frame.decoded_bits for frame in self.frames]
+        )
 
     @cached_property
     def symbols(self) -> Symbols:
@@ -761,16 +755,13 @@ class TransmittingModem(BaseModem, Transmitter[CommunicationTransmission], Seria
 
         # For each stream resulting from the initial encoding stage
         # Place and encode the symbols according to the stream transmit coding configuration
-        frame_samples = np.empty(
-            (symbols.num_streams, self.waveform.samples_per_frame), dtype=np.complex_
-        )
-        for s, stream_symbols in enumerate(symbols.raw):
-            placed_symbols = self.waveform.place(
-                Symbols(stream_symbols[np.newaxis, :, :])
-            )
+        placed_symbols = [
+            self.waveform.place(Symbols(stream_symbols[np.newaxis, :, :]))
+            for stream_symbols in symbols.raw
+        ]
 
-            # Modulate each placed symbol stream individually to its base-band signal representation
-            frame_samples[s, :] = self.waveform.modulate(placed_symbols)
+        # Modulate the placed symbol streams to their base-band signal representation
+        frame_samples = self.waveform.modulate_batch(placed_symbols)
 
         # Apply the stream transmit coding configuration
         frame_signal = Signal(
@@ -830,6 +821,8 @@ class TransmittingModem(BaseModem, Transmitter[CommunicationTransmission], Seria
             return transmission
 
         frames: List[CommunicationTransmissionFrame] = []
+        frame_samples: List[np.ndarray] = []
+        mapped_states: np.ndarray | None = None
         for n in range(num_mimo_frames):
             # Generate plain data bits
             data_bits = self.bits_source.generate_bits(required_num_data_bits)
@@ -840,21 +833,21 @@ class TransmittingModem(BaseModem, Transmitter[CommunicationTransmission], Seria
             # Map bits to communication symbols
             mapped_symbols = self.__map(encoded_bits, self.precoding.num_input_streams)
 
-            # Apply the first symbol precoding cofiguration
-            encoded_symbols = self.precoding.encode(
-                StatedSymbols(
-                    mapped_symbols.raw,
-                    np.ones(
-                        (
-                            mapped_symbols.num_streams,
-                            1,
-                            mapped_symbols.num_blocks,
-                            mapped_symbols.num_symbols,
-                        ),
-                        dtype=np.complex_,
+            # The ideal channel states of mapped symbols are identical for all frames
+            if mapped_states is None:
+                mapped_states = np.ones(
+                    (
+                        mapped_symbols.num_streams,
+                        1,
+                        mapped_symbols.num_blocks,
+                        mapped_symbols.num_symbols,
                     ),
+                    dtype=np.complex_,
                 )
-            )
+                mapped_states.flags.writeable = False
+
+            # Apply the first symbol precoding cofiguration
+            encoded_symbols = self.precoding.encode(StatedSymbols(mapped_symbols.raw, mapped_states))
 
             # Modulate symbols to a base-band signal
             frame_signal = self.__modulate(encoded_symbols)
@@ -863,7 +856,7 @@ class TransmittingModem(BaseModem, Transmitter[CommunicationTransmission], Seria
             encoded_frame_signal = self.__transmit_stream_coding.encode(frame_signal)
 
             # Save results
-            signal.append_samples(encoded_frame_signal)
+            frame_samples.append(encoded_frame_signal.samples)
             frames.append(
                 CommunicationTransmissionFrame(
                     signal=frame_signal,
@@ -875,6 +868,9 @@ class TransmittingModem(BaseModem, Transmitter[CommunicationTransmission], Seria
                 )
             )
 
+        # Concatenate all frames at once instead of growing the signal frame by frame
+        signal.samples = np.concatenate(frame_samples, axis=1)
+
         # Update the assumed signal carrier frequency to RF band
         signal.carrier_frequency = self.carrier_frequency
 
@@ -956,22 +952,47 @@ class ReceivingModem(BaseModem, Receiver[CommunicationReception], Serializable):
             A sequence signals representing communication frames and their respective detection indices.
         """
 
+        # Enforce C-contiguous samples once, so that frame views don't trigger copies downstream
+        samples = received_signal.samples
+        if not samples.flags.c_contiguous:
+            samples = np.ascontiguousarray(samples)
+
         # Synchronize raw MIMO data into frames
-        frame_start_indices = self.waveform.synchronization.synchronize(
-            received_signal.samples
-        )
+        frame_start_indices = self.waveform.synchronization.synchronize(samples)
         frame_length = self.waveform.samples_per_frame
 
-        synchronized_signals = []
-        for frame_start in frame_start_indices:
-            frame_stop = frame_start + frame_length
-            frame_samples = received_signal.samples[:, frame_start:frame_stop]
-            frame_signal = Signal(frame_samples, received_signal.sampling_rate)
-
-            synchronized_signals.append(frame_signal)
+        # Frame signals are views of the received samples instead of copies,
+        # since the received signal is a modem-internal resampled copy and demodulation
+        # does not modify samples in-place
+        synchronized_signals = [
+            self.__frame_signal(
+                samples[:, frame_start : frame_start + frame_length], received_signal.sampling_rate
+            )
+            for frame_start in frame_start_indices
+        ]
 
         return frame_start_indices, synchronized_signals
 
+    @staticmethod
+    def __frame_signal(samples: np.ndarray, sampling_rate: float) -> Signal:
+        """Wrap synchronized frame samples into a signal model without copying them.
+
+        Args:
+
+            samples (np.ndarray):
+                Samples of a single communication frame.
+
+            sampling_rate (float):
+                Sampling rate of the frame samples in Hz.
+
+        Returns: Signal model referencing the frame samples.
+        """
+
+        frame_signal = Signal.empty(sampling_rate, samples.shape[0])
+        frame_signal.samples = samples
+
+        return frame_signal
+
     def __demodulate(self, frame: Signal) -> Symbols:
         """Demodulates a sequence of synchronized MIMO signals into data symbols.
 
@@ -985,12 +1006,7 @@ class ReceivingModem(BaseModem, Receiver[CommunicationReception], Serializable):
             Demodulated frame symbols.
         """
 
-        symbols = Symbols()
-        for stream in frame.samples:
-            stream_symbols = self.waveform.demodulate(stream)
-            symbols.append_stream(stream_symbols)
-
-        return symbols
+        return self.waveform.demodulate_batch(frame.samples)
 
     def __unmap(self, symbols: Symbols) -> np.ndarray:
         """Unmap a set of communication symbols to information bits.
@@ -1004,11 +1020,10 @@ class ReceivingModem(BaseModem, Receiver[CommunicationReception], Serializable):
             A numpy array containing hard information bits.
         """
 
-        bits = np.empty(0, dtype=np.uint8)
-        for stream in symbols.raw:
-            bits = np.append(bits, self.waveform.unmap(Symbols(stream[np.newaxis, :, :])))
-
-        return bits
+        return np.concatenate(
+            [np.empty(0, dtype=np.uint8)]
+            + [self.waveform.unmap(Symbols(stream[np.newaxis, :, :])) for stream in symbols.raw]
+        )
 
     def _receive(self, signal: Signal) -> CommunicationReception:
         # Resample the signal to match the waveform's requirements
@@ -149,9 +149,16 @@ class SymbolPrecoding(Precoding[SymbolPrecoder], Serializable):
         Returns: Number of blocks after encoding.
         """
 
-        num_blocks = Fraction(num_input_blocks, 1)
+        # Accumulate the inverse rates as integer products,
+        # avoiding the repeated normalization of fraction divisions
+        numerator = num_input_blocks
+        denominator = 1
 
         for precoder in self:
-            num_blocks /= precoder.rate
+            # Precoder rates may be reported as plain integers or floats,
+            # whose inexact binary representations are rounded to the closest simple fraction
+            rate = Fraction(precoder.rate).limit_denominator()
+            numerator *= rate.denominator
+            denominator *= rate.numerator
 
-        return int(num_blocks)
+        return numerator // denominator
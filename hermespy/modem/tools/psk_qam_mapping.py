@@ -202,7 +202,7 @@ class PskQamMapping(object):
         llr = np.zeros(number_of_bits)
 
         noise_variance = (
-            noise_variance * np.ones(rx_symbols.shape)
+            np.broadcast_to(noise_variance, rx_symbols.shape)
             if isinstance(noise_variance, float)
             else noise_variance
         )
@@ -289,6 +289,9 @@ class PskQamMapping(object):
                 values can be -7, -5, -3, -1, 1, 3, 5, 7.
         """
 
+        # Unsigned bits would wrap around within the signed amplitude expressions
+        bits = bits.astype(np.int8, copy=False)
+
         if modulation_order == 2:
             symbols = 1.0 - 2 * bits
         elif modulation_order == 4:
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from math import ceil
-from typing import Generic, TYPE_CHECKING, Optional, TypeVar, List
+from typing import Generic, TYPE_CHECKING, Optional, Tuple, TypeVar, List
 
 import numpy as np
 from sparse import GCXS  # type: ignore
@@ -65,12 +64,13 @@ class Synchronization(Generic[WaveformType], ABC, Serializable):
     def waveform(self, value: Optional[WaveformType]) -> None:
         """Set waveform generator this synchronization routine is attached to."""
 
-        # Un-register this synchronization routine from its previously assigned waveform
+        # Un-register this synchronization routine from its previously assigned waveform,
+        # which will lazily fall back to its default routine
         if (
             self.__waveform is not None
             and self.__waveform.synchronization is self
         ):
-            self.__waveform.synchronization = Synchronization()
+            self.__waveform.synchronization = None
 
         self.__waveform = value
 
@@ -137,11 +137,11 @@ class ChannelEstimation(Generic[WaveformType], Serializable):
             self.__waveform = None
 
             if waveform is not None:
-                waveform.channel_estimation = ChannelEstimation()
+                waveform.channel_estimation = None
 
         else:
             if self.__waveform is not value and self.__waveform is not None:
-                self.__waveform.channel_estimation = ChannelEstimation()
+                self.__waveform.channel_estimation = None
 
             self.__waveform = value
             value.channel_estimation = self
@@ -233,7 +233,34 @@ class ZeroForcingChannelEqualization(
             equalized_symbols = symbols.raw / summed_tx_states
 
         else:
-            equalization = np.linalg.pinv(symbols.dense_states().transpose((2, 3, 0, 1)))
+            states = symbols.dense_states().transpose((2, 3, 0, 1))
+
+            # For at least as many receive as transmit streams, the zero-forcing solution
+            # is computed from a QR decomposition of the channel states, which is considerably cheaper
+            # than the singular value decompositions required by the pseudo-inverse.
+            # Unlike the normal equations, it does not square the states' condition number.
+            if symbols.num_streams >= symbols.num_transmit_streams:
+                q, r = np.linalg.qr(states)
+
+                # Fall back to the pseudo-inverse for numerically rank-deficient channel states,
+                # applying the same tolerance as numpy's matrix rank estimation
+                diagonal = np.abs(np.diagonal(r, axis1=-2, axis2=-1))
+                tolerance = (
+                    diagonal.max(axis=-1, keepdims=True)
+                    * symbols.num_streams
+                    * np.finfo(diagonal.dtype).eps
+                )
+
+                if np.all(diagonal > tolerance):
+                    equalized_symbols = np.linalg.solve(
+                        r,
+                        q.conj().swapaxes(-1, -2)
+                        @ symbols.raw.transpose((1, 2, 0))[..., np.newaxis],
+                    )[..., 0].transpose((2, 0, 1))
+
+                    return Symbols(equalized_symbols)
+
+            equalization = np.linalg.pinv(states)
             equalized_symbols = np.einsum("ijkl,lij->kij", equalization, symbols.raw)
 
         return Symbols(equalized_symbols)
@@ -249,12 +276,13 @@ class CommunicationWaveform(ABC, Serializable):
 
     # Modem this waveform generator is attached to
     __modem: Optional[BaseModem]
-    __synchronization: Synchronization  # Synchronization routine
-    __channel_estimation: ChannelEstimation  # Channel estimation routine
-    __channel_equalization: ChannelEqualization  # Channel equalization routine
+    __synchronization: Optional[Synchronization]  # Synchronization routine
+    __channel_estimation: Optional[ChannelEstimation]  # Channel estimation routine
+    __channel_equalization: Optional[ChannelEqualization]  # Channel equalization routine
     __oversampling_factor: int  # Oversampling factor
     # Cardinality of the set of communication symbols
     __modulation_order: int
+    __bits_per_symbol: int  # Number of bits encoded by each symbol
 
     def __init__(
         self,
@@ -283,22 +311,20 @@ class CommunicationWaveform(ABC, Serializable):
         self.__modem = None
         self.oversampling_factor = oversampling_factor
         self.modulation_order = modulation_order
-        self.synchronization = Synchronization(self)
-        self.channel_estimation = (
-            ChannelEstimation(self) if channel_estimation is None else channel_estimation
-        )
-        self.channel_equalization = (
-            ChannelEqualization(self) if channel_equalization is None else channel_equalization
-        )
 
-        if modem is not None:
-            self.modem = modem
+        # Default processing routines are only created on first access
+        self.__synchronization = None
+        self.__channel_estimation = None
+        self.__channel_equalization = None
+
+        if channel_estimation is not None:
+            self.channel_estimation = channel_estimation
 
-        if oversampling_factor is not None:
-            self.oversampling_factor = oversampling_factor
+        if channel_equalization is not None:
+            self.channel_equalization = channel_equalization
 
-        if modulation_order is not None:
-            self.modulation_order = modulation_order
+        if modem is not None:
+            self.modem = modem
 
     @property
     def oversampling_factor(self) -> int:
@@ -359,6 +385,7 @@ class CommunicationWaveform(ABC, Serializable):
             raise ValueError("Modulation order must be a positive power of two")
 
         self.__modulation_order = order
+        self.__bits_per_symbol = int(order).bit_length() - 1
 
     @property
     def bits_per_symbol(self) -> int:
@@ -368,7 +395,7 @@ class CommunicationWaveform(ABC, Serializable):
             int: Number of bits per symbol
         """
 
-        return int(np.log2(self.modulation_order))
+        return self.__bits_per_symbol
 
     def bits_per_frame(self, num_data_symbols: int | None = None) -> int:
         """Number of bits required to generate a single data frame.
@@ -528,6 +555,49 @@ class CommunicationWaveform(ABC, Serializable):
         """
         ...  # pragma: no cover
 
+    def modulate_batch(self, symbols_batch: List[Symbols]) -> np.ndarray:
+        """Modulate a batch of data symbol streams to base-band signals.
+
+        By default, each stream is modulated individually by :meth:`.modulate`.
+        Waveforms may override this method with a vectorized implementation.
+
+        Args:
+
+            symbols_batch (List[Symbols]):
+                Singular streams of placed data symbols to be modulated by this waveform.
+
+        Returns:
+            Matrix of base-band samples of dimensions `num_streams`x`samples_per_frame`.
+        """
+
+        frame_samples = np.empty((len(symbols_batch), self.samples_per_frame), dtype=np.complex_)
+        for s, symbols in enumerate(symbols_batch):
+            frame_samples[s, :] = self.modulate(symbols)
+
+        return frame_samples
+
+    def demodulate_batch(self, signal: np.ndarray) -> Symbols:
+        """Demodulate a batch of base-band signal streams to data symbols.
+
+        By default, each stream is demodulated individually by :meth:`.demodulate`.
+        Waveforms may override this method with a vectorized implementation.
+
+        Args:
+
+            signal (np.ndarray):
+                Matrix of complex-valued base-band samples of dimensions `num_streams`x`num_samples`,
+                each row representing a single communication frame.
+
+        Returns:
+            The demodulated communication symbols of all streams.
+        """
+
+        symbols = Symbols()
+        for stream in signal:
+            symbols.append_stream(self.demodulate(stream))
+
+        return symbols
+
     def estimate_channel(self, frame: Symbols, frame_delay: float = 0.0) -> StatedSymbols:
         return self.channel_estimation.estimate_channel(frame, frame_delay)
 
@@ -602,51 +672,66 @@ class CommunicationWaveform(ABC, Serializable):
     def synchronization(self) -> Synchronization:
         """Synchronization routine.
 
+        Setting `None` restores the default routine on the next access.
+
         Returns:
             Synchronization: Handle to the synchronization routine.
         """
 
-        return self.__synchronization
+        if self.__synchronization is None:
+            self.synchronization = Synchronization(self)
+
+        return self.__synchronization  # type: ignore
 
     @synchronization.setter
-    def synchronization(self, value: Synchronization) -> None:
+    def synchronization(self, value: Optional[Synchronization]) -> None:
         self.__synchronization = value
 
-        if value.waveform is not self:
+        if value is not None and value.waveform is not self:
             value.waveform = self
 
     @property
     def channel_estimation(self) -> ChannelEstimation:
         """Channel estimation routine.
 
+        Setting `None` restores the default routine on the next access.
+
         Returns:
             ChannelEstimation: Handle to the estimation routine.
         """
 
-        return self.__channel_estimation
+        if self.__channel_estimation is None:
+            self.channel_estimation = ChannelEstimation(self)
+
+        return self.__channel_estimation  # type: ignore
 
     @channel_estimation.setter
-    def channel_estimation(self, value: ChannelEstimation) -> None:
+    def channel_estimation(self, value: Optional[ChannelEstimation]) -> None:
         self.__channel_estimation = value
 
-        if value.waveform is not self:
+        if value is not None and value.waveform is not self:
             value.waveform = self
 
     @property
     def channel_equalization(self) -> ChannelEqualization:
         """Channel estimation routine.
 
+        Setting `None` restores the default routine on the next access.
+
         Returns:
             ChannelEqualization: Handle to the equalization routine.
         """
 
-        return self.__channel_equalization
+        if self.__channel_equalization is None:
+            self.channel_equalization = ChannelEqualization(self)
+
+        return self.__channel_equalization  # type: ignore
 
     @channel_equalization.setter
-    def channel_equalization(self, value: ChannelEqualization) -> None:
+    def channel_equalization(self, value: Optional[ChannelEqualization]) -> None:
         self.__channel_equalization = value
 
-        if value.waveform is not self:
+        if value is not None and value.waveform is not self:
             value.waveform = self
 
     @property
@@ -707,6 +792,7 @@ class UniformPilotSymbolSequence(PilotSymbolSequence):
     """
 
     __pilot_symbol: complex  # The configured pilot symbol
+    __sequence: np.ndarray  # Read-only sequence containing the pilot symbol
 
     def __init__(self, pilot_symbol: complex = 1.0 + 0.0j) -> None:
         """
@@ -718,10 +804,12 @@ class UniformPilotSymbolSequence(PilotSymbolSequence):
         """
 
         self.__pilot_symbol = pilot_symbol
+        self.__sequence = np.array([pilot_symbol], dtype=complex)
+        self.__sequence.flags.writeable = False
 
     @property
     def sequence(self) -> np.ndarray:
-        return np.array([self.__pilot_symbol], dtype=complex)
+        return self.__sequence
 
 
 class CustomPilotSymbolSequence(PilotSymbolSequence):
@@ -767,6 +855,9 @@ class ConfigurablePilotWaveform(PilotCommunicationWaveform):
     repeat_pilot_symbol_sequence: bool
     """Allow the repetition of pilot symbol sequences."""
 
+    # Most recently repeated symbol sequence, its requested length and the resulting pilots
+    __repeated_pilot_symbols: Optional[Tuple[np.ndarray, int, np.ndarray]]
+
     def __init__(
         self,
         symbol_sequence: PilotSymbolSequence | None = None,
@@ -792,6 +883,7 @@ class ConfigurablePilotWaveform(PilotCommunicationWaveform):
             UniformPilotSymbolSequence() if symbol_sequence is None else symbol_sequence
         )
         self.repeat_pilot_symbol_sequence = repeat_symbol_sequence
+        self.__repeated_pilot_symbols = None
 
         # Initialize base class
         PilotCommunicationWaveform.__init__(self, **kwargs)
@@ -813,7 +905,8 @@ class ConfigurablePilotWaveform(PilotCommunicationWaveform):
         """
 
         symbol_sequence = self.pilot_symbol_sequence.sequence
-        num_repetitions = int(ceil(num_symbols / len(symbol_sequence)))
+        sequence_length = symbol_sequence.shape[0]
+        num_repetitions = -(-num_symbols // sequence_length)
 
         if num_repetitions > 1:
             if not self.repeat_pilot_symbol_sequence:
@@ -821,6 +914,25 @@ class ConfigurablePilotWaveform(PilotCommunicationWaveform):
                     "Pilot symbol repetition required for sequence generation but not allowed"
                 )
 
-            symbol_sequence = np.tile(symbol_sequence, num_repetitions)
+            # Reuse the previous repetition if neither the sequence nor the length changed
+            cache = self.__repeated_pilot_symbols
+            if cache is not None and cache[0] is symbol_sequence and cache[1] == num_symbols:
+                return cache[2]
+
+            # Broadcast full repetitions directly into the output buffer,
+            # avoiding an intermediate tiled sequence exceeding the required length
+            num_full_repetitions = num_symbols // sequence_length
+            num_tiled_symbols = num_full_repetitions * sequence_length
+
+            pilot_symbols = np.empty(num_symbols, dtype=symbol_sequence.dtype)
+            pilot_symbols[:num_tiled_symbols].reshape(
+                (num_full_repetitions, sequence_length)
+            )[:] = symbol_sequence
+            pilot_symbols[num_tiled_symbols:] = symbol_sequence[: num_symbols - num_tiled_symbols]
+
+            pilot_symbols.flags.writeable = False
+            self.__repeated_pilot_symbols = (symbol_sequence, num_symbols, pilot_symbols)
+
+            return pilot_symbols
 
         return symbol_sequence[:num_symbols]
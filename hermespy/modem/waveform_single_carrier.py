@@ -644,17 +644,11 @@ class SingleCarrierMinimumMeanSquareChannelEqualization(SingleCarrierChannelEqua
                 "MMSE equalization is not supported for more transmit streams than receive streams"
             )
 
-        # Default behaviour for mimo systems is to use the pseudo-inverse for equalization
-        raw_equalized_symbols = np.empty(
-            (symbols.num_transmit_streams, symbols.num_blocks, symbols.num_symbols), dtype=complex
-        )
-        for b, s in np.ndindex(symbols.num_blocks, symbols.num_symbols):
-            symbol_slice = symbols.raw[:, b, s]
-            mimo_state = symbols.states[:, :, b, s]
-
-            # ToDo: Introduce noise term here
-            equalization = np.linalg.pinv(mimo_state)
-            raw_equalized_symbols[:, b, s] = equalization @ symbol_slice
+        # Default behaviour for mimo systems is to use the pseudo-inverse for equalization,
+        # computed for all blocks and symbols within a single stacked call
+        # ToDo: Introduce noise term here
+        equalization = np.linalg.pinv(symbols.dense_states().transpose((2, 3, 0, 1)))
+        raw_equalized_symbols = np.einsum("ijkl,lij->kij", equalization, symbols.raw)
 
         return Symbols(raw_equalized_symbols)
 
@@ -6,13 +6,13 @@ Frequency-Selective Isolation
 """
 
 from __future__ import annotations
-from typing import Type, TYPE_CHECKING
+from typing import Optional, Type, TYPE_CHECKING
 
 import numpy as np
 from scipy.signal import convolve
 from scipy.fft import ifft
 
-from hermespy.core import Serializable, Signal
+from hermespy.core import RandomNode, Serializable, Signal
 from .isolation import Isolation
 
 if TYPE_CHECKING:
@@ -29,7 +29,7 @@ __email__ = "jan.adler@barkhauseninstitut.org"
 __status__ = "Prototype"
 
 
-class SelectiveLeakage(Serializable, Isolation):
+class SelectiveLeakage(Serializable, RandomNode, Isolation):
     """Model of frequency-selective transmit-receive leakage."""
 
     yaml_tag = "SelectiveLeakage"
@@ -51,17 +51,13 @@ class SelectiveLeakage(Serializable, Isolation):
             ValueError: If the leakage response matrix has invalid dimensions.
         """
 
-        if leakage_response.ndim != 3:
-            raise ValueError(
-                f"Leakage response matrix must be a three-dimensional array (has {leakage_response.ndim} dimensions)"
-            )
-
         # Initialize base classes
         Serializable.__init__(self)
+        RandomNode.__init__(self)
         Isolation.__init__(self, *args, **kwargs)
 
         # Initialize class attributes
-        self.__leakage_response = leakage_response
+        self.leakage_response = leakage_response
 
     @classmethod
     def Normal(
@@ -75,6 +71,14 @@ class SelectiveLeakage(Serializable, Isolation):
 
         Args:
 
+            device (SimulatedDevice):
+                Device the leakage model is configured for.
+                Random realizations are drawn from the device's random number generator.
+
+            num_samples (int, optional):
+                Number of samples in the frequency response.
+                100 by default.
+
             mean (float, optional):
                 Mean of the frequency response in real and imaginary parts.
                 One by default.
@@ -86,26 +90,26 @@ class SelectiveLeakage(Serializable, Isolation):
         Returns: An initialized selective frequency model.
         """
 
-        frequency_response = np.random.normal(
-            np.sqrt(0.5) * mean,
-            variance,
-            (
-                device.antennas.num_receive_antennas,
-                device.antennas.num_transmit_antennas,
-                num_samples,
-            ),
-        ) + 1j * np.random.normal(
-            np.sqrt(0.5) * mean,
-            variance,
-            (
-                device.antennas.num_receive_antennas,
-                device.antennas.num_transmit_antennas,
-                num_samples,
-            ),
+        response_shape = (
+            device.antennas.num_receive_antennas,
+            device.antennas.num_transmit_antennas,
+            num_samples,
         )
-        leakage_response = ifft(frequency_response, axis=2, norm="backward")
 
-        return cls(leakage_response=leakage_response)
+        # The leakage model's random mother is the device,
+        # so the frequency response is drawn from the device's random number generator
+        leakage = cls(np.empty(response_shape, dtype=np.complex_), device=device)
+        frequency_response = leakage._rng.normal(
+            np.sqrt(0.5) * mean, variance, response_shape
+        ) + 1j * leakage._rng.normal(np.sqrt(0.5) * mean, variance, response_shape)
+        leakage.leakage_response = ifft(frequency_response, axis=2, norm="backward")
+
+        return leakage
+
+    @Isolation.device.setter  # type: ignore
+    def device(self, value: Optional[SimulatedDevice]) -> None:
+        Isolation.device.fset(self, value)  # type: ignore
+        self.random_mother = value
 
     @property
     def leakage_response(self) -> np.ndarray:
@@ -114,10 +118,23 @@ class SelectiveLeakage(Serializable, Isolation):
         Numpy matrix of dimensions :math:`M \\times N \\times L`,
         where :math:`M` is the number of receive streams and :math:`N` is the number of transmit streams and
         :math:`L` is the number of samples in the impulse response.
+
+        Raises:
+
+            ValueError: If the leakage response matrix has invalid dimensions.
         """
 
         return self.__leakage_response
 
+    @leakage_response.setter
+    def leakage_response(self, value: np.ndarray) -> None:
+        if value.ndim != 3:
+            raise ValueError(
+                f"Leakage response matrix must be a three-dimensional array (has {value.ndim} dimensions)"
+            )
+
+        self.__leakage_response = value
+
     def _leak(self, signal: Signal) -> Signal:
         num_leaked_samples = self.leakage_response.shape[2] + signal.num_samples - 1
         leaking_samples = np.zeros(
@@ -27,6 +27,12 @@ __status__ = "Prototype"
 class PhaseNoise(RandomNode, ABC):
     """Base class of phase noise models."""
 
+    enabled: bool = True
+    """Whether the model actually distorts signals.
+
+    Callers may skip :meth:`add_noise` for models reporting `False`.
+    """
+
     @abstractmethod
     def add_noise(self, signal: Signal) -> Signal:
         """Add phase noise to a signal model.
@@ -47,6 +53,8 @@ class NoPhaseNoise(PhaseNoise, Serializable):
     yaml_tag = "NoPhaseNoise"
     """YAML serialization tag"""
 
+    enabled = False
+
     def add_noise(self, signal: Signal) -> Signal:
         # It's just a stub
         return signal
@@ -107,13 +107,12 @@ class RfChain(Serializable):
         According to transmission impairments.
         """
 
-        transmitted_signal = input_signal.copy()
-
         # Simulate IQ imbalance
-        transmitted_signal.samples = self.add_iq_imbalance(transmitted_signal.samples)
+        transmitted_signal = self.__iq_imbalanced_signal(input_signal)
 
         # Simulate phase noise
-        transmitted_signal = self.phase_noise.add_noise(transmitted_signal)
+        if self.phase_noise.enabled:
+            transmitted_signal = self.phase_noise.add_noise(transmitted_signal)
 
         # Simulate power amplifier
         if self.power_amplifier is not None:
@@ -142,7 +141,32 @@ class RfChain(Serializable):
         eta_alpha = np.cos(eps_delta / 2) + 1j * eps_a * np.sin(eps_delta / 2)
         eta_beta = eps_a * np.cos(eps_delta / 2) - 1j * np.sin(eps_delta / 2)
 
-        return eta_alpha * x + eta_beta * np.conj(x)
+        imbalanced_signal = eta_alpha * x
+        imbalanced_signal += eta_beta * np.conj(x)
+
+        return imbalanced_signal
+
+    def __iq_imbalanced_signal(self, signal: Signal) -> Signal:
+        """Apply the IQ imbalance to a signal model.
+
+        Since the imbalance produces a new sample matrix anyway,
+        the signal's samples are not copied beforehand.
+
+        Args:
+            signal (Signal): Signal model to be deteriorated.
+
+        Returns: New deteriorated signal model.
+        """
+
+        imbalanced_signal = Signal.empty(
+            signal.sampling_rate,
+            carrier_frequency=signal.carrier_frequency,
+            delay=signal.delay,
+            noise_power=signal.noise_power,
+        )
+        imbalanced_signal.samples = self.add_iq_imbalance(signal.samples)
+
+        return imbalanced_signal
 
     def receive(self, input_signal: Signal) -> Signal:
         """Returns the distorted version of signal in "input_signal".
@@ -150,13 +174,12 @@ class RfChain(Serializable):
         According to reception impairments.
         """
 
-        input_signal = input_signal.copy()
-
         # Simulate IQ imbalance
-        input_signal.samples = self.add_iq_imbalance(input_signal.samples)
+        input_signal = self.__iq_imbalanced_signal(input_signal)
 
         # Simulate phase noise
-        input_signal = self.phase_noise.add_noise(input_signal)
+        if self.phase_noise.enabled:
+            input_signal = self.phase_noise.add_noise(input_signal)
 
         return input_signal
 
@@ -24,10 +24,18 @@ __status__ = "Prototype"
 class TestCaponBeamformer(TestCase):
     """Test the Capon beamformer implementation"""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.carrier_frequency = 1e9
+        cls.device = SimulatedDevice(carrier_frequency=cls.carrier_frequency, antennas=SimulatedUniformArray(SimulatedIdealAntenna, 0.01, (5, 5, 1)))
+
+        # Array responses towards the focus angles of interest
+        cls.focus_angles = 0.25 * pi * np.array([[0.0, 0.0], [0, 1], [1, 1], [1, -1], [1, 2], [1, -2]])
+        cls.responses = np.stack([cls.device.antennas.spherical_phase_response(cls.carrier_frequency, focus_angle[0], focus_angle[1]) for focus_angle in cls.focus_angles]).astype(np.complex64)
+
     def setUp(self) -> None:
         self.rng = np.random.default_rng(42)
 
-        self.device = SimulatedDevice(carrier_frequency=1e9, antennas=SimulatedUniformArray(SimulatedIdealAntenna, 0.01, (5, 5, 1)))
         self.operator = Mock()
         self.operator.device = self.device
 
@@ -65,19 +73,15 @@ class TestCaponBeamformer(TestCase):
     def test_decode(self) -> None:
         """Encoding and decoding towards identical angles should recover the signal"""
 
-        focus_angles = 0.25 * pi * np.array([[0.0, 0.0], [0, 1], [1, 1], [1, -1], [1, 2], [1, -2]])
         expected_samples = np.exp(2j * pi * self.rng.uniform(0, 1, 10))
-        noise = 1e-2j * self.rng.normal(size=(25, 10)) + 1e-2j * self.rng.normal(size=(25, 10))
-
-        carrier_frequency = 1e9
+        noise = 1e-2 * self.rng.standard_normal((25, 10, 2)).view(complex)[:, :, 0]
 
-        for f, focus_angle in enumerate(focus_angles):
-            response = self.operator.device.antennas.spherical_phase_response(carrier_frequency, focus_angle[0], focus_angle[1])
-            noiseless_spatial_samples = response[:, np.newaxis] @ expected_samples[np.newaxis, :]
-            noisy_spatial_samples = noiseless_spatial_samples + noise
+        noiseless_samples = self.responses[:, :, np.newaxis] * expected_samples[np.newaxis, np.newaxis, :]
+        noisy_samples = noiseless_samples + noise[np.newaxis, :, :]
 
-            noiseless_decoded_samples = self.beamformer._decode(noiseless_spatial_samples, carrier_frequency, focus_angles[:, np.newaxis, :], self.device.antennas)
-            noisy_decoded_samples = self.beamformer._decode(noisy_spatial_samples, carrier_frequency, focus_angles[:, np.newaxis, :], self.device.antennas)
+        for f, (noiseless_spatial_samples, noisy_spatial_samples) in enumerate(zip(noiseless_samples, noisy_samples)):
+            noiseless_decoded_samples = self.beamformer._decode(noiseless_spatial_samples, self.carrier_frequency, self.focus_angles[:, np.newaxis, :], self.device.antennas)
+            noisy_decoded_samples = self.beamformer._decode(noisy_spatial_samples, self.carrier_frequency, self.focus_angles[:, np.newaxis, :], self.device.antennas)
 
             noisy_directive_power = np.linalg.norm(noisy_decoded_samples, axis=(1, 2))
 
@@ -8,6 +8,7 @@ from numpy.testing import assert_array_almost_equal
 from scipy.constants import pi
 
 from hermespy.beamforming import ConventionalBeamformer
+from hermespy.core import Precision
 from hermespy.simulation import SimulatedDevice, SimulatedIdealAntenna, SimulatedUniformArray
 from unit_tests.core.test_factory import test_yaml_roundtrip_serialization
 
@@ -49,6 +50,52 @@ class TestConventionalBeamformer(TestCase):
         self.assertEqual(5, self.beamformer.num_transmit_output_streams)
         self.assertEqual(1, self.beamformer.num_transmit_input_streams)
 
+    def test_codebook(self) -> None:
+        """Codebook entries should match the array's spherical phase responses"""
+
+        angles = self.rng.uniform(0, pi, (10, 2))
+        carrier_frequency = 1e9
+
+        codebook = self.beamformer._codebook(carrier_frequency, angles, self.device.antennas)
+
+        self.assertSequenceEqual((10, 5), codebook.shape)
+        for (azimuth, zenith), steering_vector in zip(angles, codebook):
+            expected_steering_vector = self.device.antennas.spherical_phase_response(carrier_frequency, azimuth, zenith) / 5
+            assert_array_almost_equal(expected_steering_vector, steering_vector)
+
+    def test_codebook_caching(self) -> None:
+        """Codebooks should be cached for identical parameters and recomputed otherwise"""
+
+        angles = self.rng.uniform(0, pi, (10, 2))
+
+        codebook = self.beamformer._codebook(1e9, angles, self.device.antennas)
+        self.assertIs(codebook, self.beamformer._codebook(1e9, angles.copy(), self.device.antennas))
+        self.assertIsNot(codebook, self.beamformer._codebook(2e9, angles, self.device.antennas))
+
+        self.device.antennas.spacing = 0.02
+        assert_array_almost_equal(
+            self.device.antennas.spherical_phase_response(1e9, angles[0, 0], angles[0, 1]) / 5,
+            self.beamformer._codebook(1e9, angles, self.device.antennas)[0, :],
+        )
+
+    def test_precision_setget(self) -> None:
+        """Precision property getter should return setter argument"""
+
+        self.beamformer.precision = Precision.SINGLE
+        self.assertIs(Precision.SINGLE, self.beamformer.precision)
+
+    def test_single_precision_codebook(self) -> None:
+        """Single precision codebooks should approximate double precision codebooks"""
+
+        angles = self.rng.uniform(0, pi, (10, 2))
+        expected_codebook = self.beamformer._codebook(1e9, angles, self.device.antennas)
+
+        self.beamformer.precision = Precision.SINGLE
+        codebook = self.beamformer._codebook(1e9, angles, self.device.antennas)
+
+        self.assertEqual(np.complex64, codebook.dtype)
+        assert_array_almost_equal(expected_codebook, codebook, decimal=6)
+
     def test_encode_decode(self) -> None:
         """Encoding and decoding towards identical angles should recover the signal"""
 
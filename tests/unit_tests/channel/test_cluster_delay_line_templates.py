@@ -5,9 +5,9 @@
 =====================================
 """
 
+from types import SimpleNamespace
 from typing import Type
 from unittest import TestCase
-from unittest.mock import Mock
 
 import numpy as np
 from numpy.random import default_rng
@@ -45,8 +45,7 @@ __status__ = "Prototype"
 class __TestClusterDelayLineTemplate(TestCase):
     def _init(self, channel: Type[ClusterDelayLine], **kwargs) -> None:
         self.rng = default_rng(42)
-        self.random_node = Mock()
-        self.random_node._rng = self.rng
+        self.random_node = SimpleNamespace(_rng=self.rng)
 
         self.num_samples = 5000
         self.sampling_rate = 1e5
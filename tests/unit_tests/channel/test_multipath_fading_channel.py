@@ -2,11 +2,9 @@
 """Test Multipath Fading Channel Model"""
 
 import unittest
-from copy import deepcopy
 from unittest.mock import Mock, patch, PropertyMock
 
 import numpy as np
-import numpy.random as rand
 import numpy.testing as npt
 from h5py import File
 from numpy import exp
@@ -128,7 +126,7 @@ class TestMultipathFadingRealization(unittest.TestCase):
         """Propagation should result in a signal with the correct number of samples"""
 
         num_samples = 100
-        signal = Signal(self.rng.normal(0, 1, size=(2, num_samples)) + 1j * self.rng.normal(0, 1, size=(2, num_samples)), self.sampling_rate)
+        signal = Signal(self.rng.standard_normal((2, num_samples, 2)).view(complex)[:, :, 0], self.sampling_rate)
 
         signal_propagation = self.realization.propagate(signal)
         state_propagation = self.realization.state(self.tx_device, self.rx_device, 0.0, self.sampling_rate, signal.num_samples, 1 + signal_propagation.signal.num_samples - signal.num_samples).propagate(signal)
@@ -139,7 +137,7 @@ class TestMultipathFadingRealization(unittest.TestCase):
         """Propagation should result in a signal with the correct number of samples in the conjugate case"""
 
         num_samples = 100
-        signal = Signal(self.rng.normal(0, 1, size=(2, num_samples)) + 1j * self.rng.normal(0, 1, size=(2, num_samples)), self.sampling_rate)
+        signal = Signal(self.rng.standard_normal((2, num_samples, 2)).view(complex)[:, :, 0], self.sampling_rate)
 
         signal_propagation = self.realization.propagate(signal, self.rx_device, self.tx_device)
         state_propagation = self.realization.state(self.rx_device, self.tx_device, 0.0, self.sampling_rate, signal.num_samples, 1 + signal_propagation.signal.num_samples - signal.num_samples).propagate(signal)
@@ -163,6 +161,7 @@ class TestMultipathFadingChannel(unittest.TestCase):
     """Test the multipath fading channel implementation"""
 
     def setUp(self) -> None:
+        self.rng = np.random.default_rng(42)
         self.gain = 0.9876
 
         self.delays = np.zeros(1, dtype=float)
@@ -203,43 +202,35 @@ class TestMultipathFadingChannel(unittest.TestCase):
         """Object initialization should raise ValueError on invalid arguments"""
 
         with self.assertRaises(ValueError):
-            params = deepcopy(self.channel_params)
-            params["delays"] = np.array([1, 2])
+            params = {**self.channel_params, "delays": np.array([1, 2])}
             _ = MultipathFadingChannel(**params)
 
         with self.assertRaises(ValueError):
-            params = deepcopy(self.channel_params)
-            params["power_profile"] = np.array([1, 2])
+            params = {**self.channel_params, "power_profile": np.array([1, 2])}
             _ = MultipathFadingChannel(**params)
 
         with self.assertRaises(ValueError):
-            params = deepcopy(self.channel_params)
-            params["rice_factors"] = np.array([1, 2])
+            params = {**self.channel_params, "rice_factors": np.array([1, 2])}
             _ = MultipathFadingChannel(**params)
 
         with self.assertRaises(ValueError):
-            params = deepcopy(self.channel_params)
-            params["delays"] = np.array([-1.0])
+            params = {**self.channel_params, "delays": np.array([-1.0])}
             _ = MultipathFadingChannel(**params)
 
         with self.assertRaises(ValueError):
-            params = deepcopy(self.channel_params)
-            params["power_profile"] = np.array([-1.0])
+            params = {**self.channel_params, "power_profile": np.array([-1.0])}
             _ = MultipathFadingChannel(**params)
 
         with self.assertRaises(ValueError):
-            params = deepcopy(self.channel_params)
-            params["rice_factors"] = np.array([-1.0])
+            params = {**self.channel_params, "rice_factors": np.array([-1.0])}
             _ = MultipathFadingChannel(**params)
 
         with self.assertRaises(ValueError):
-            params = deepcopy(self.channel_params)
-            params["delays"] = np.ones((1, 2))
+            params = {**self.channel_params, "delays": np.ones((1, 2))}
             _ = MultipathFadingChannel(**params)
 
         with self.assertRaises(ValueError):
-            params = deepcopy(self.channel_params)
-            params["delays"] = np.empty((0,))
+            params = {**self.channel_params, "delays": np.empty((0,))}
             _ = MultipathFadingChannel(**params)
 
     def test_delays_get(self) -> None:
@@ -389,14 +380,14 @@ class TestMultipathFadingChannel(unittest.TestCase):
         transmit_samples = np.exp(2j * pi * timestamps * self.transmit_frequency).reshape((1, self.num_samples))
         transmit_signal = Signal(transmit_samples, self.sampling_rate)
 
-        for d, delay in enumerate(test_delays):
+        reference_channel.seed = 42
+        reference_propagation = reference_channel.propagate(transmit_signal)
+
+        for delay in test_delays:
             delayed_params["delays"] = reference_params["delays"] + delay
             delayed_channel = MultipathFadingChannel(**delayed_params)
 
-            reference_channel.seed = d
-            reference_propagation = reference_channel.propagate(transmit_signal)
-
-            delayed_channel.seed = d
+            delayed_channel.seed = 42
             delayed_propagation = delayed_channel.propagate(transmit_signal)
 
             zero_pads = int(self.sampling_rate * float(delay))
@@ -420,7 +411,7 @@ class TestMultipathFadingChannel(unittest.TestCase):
 
         channel = MultipathFadingChannel(**self.channel_params)
 
-        samples = np.array([])
+        sample_buffer = np.empty(max_number_of_drops * samples_per_drop, dtype=complex)
 
         is_rayleigh = False
         alpha = 0.05
@@ -430,7 +421,8 @@ class TestMultipathFadingChannel(unittest.TestCase):
         while not is_rayleigh and number_of_drops < max_number_of_drops:
             realization = channel.realize()
             state = realization.state(self.alpha_device, self.beta_device, 0.0, self.doppler_frequency, samples_per_drop, 1)
-            samples = np.append(samples, state.dense_state().ravel())
+            sample_buffer[number_of_drops * samples_per_drop : (1 + number_of_drops) * samples_per_drop] = state.dense_state().ravel()
+            samples = sample_buffer[: (1 + number_of_drops) * samples_per_drop]
 
             _, p_real = stats.kstest(np.real(samples), "norm", args=(0, 1 / np.sqrt(2)))
             _, p_imag = stats.kstest(np.imag(samples), "norm", args=(0, 1 / np.sqrt(2)))
@@ -460,7 +452,7 @@ class TestMultipathFadingChannel(unittest.TestCase):
         self.channel_params["doppler_frequency"] = doppler_frequency
 
         channel = MultipathFadingChannel(**self.channel_params)
-        samples = np.array([])
+        sample_buffer = np.empty(max_number_of_drops * samples_per_drop, dtype=complex)
 
         is_rice = False
         alpha = 0.05
@@ -469,7 +461,8 @@ class TestMultipathFadingChannel(unittest.TestCase):
         while not is_rice and number_of_drops < max_number_of_drops:
             realization = channel.realize()
             state = realization.state(self.alpha_device, self.beta_device, 0.0, self.sampling_rate, samples_per_drop, 1)
-            samples = np.append(samples, state.dense_state().ravel())
+            sample_buffer[number_of_drops * samples_per_drop : (1 + number_of_drops) * samples_per_drop] = state.dense_state().ravel()
+            samples = sample_buffer[: (1 + number_of_drops) * samples_per_drop]
 
             dummy, p_real = stats.kstest(np.abs(samples), "rice", args=(np.sqrt(2), 0, 1 / 2))
 
@@ -502,14 +495,16 @@ class TestMultipathFadingChannel(unittest.TestCase):
 
         delayed_channel = MultipathFadingChannel(**self.channel_params)
 
+        max_num_taps = 1
+        delayed_time = np.arange(max_num_taps) / self.sampling_rate
+        delay_diff = (delayed_time - np.mean(delayed_time)) ** 2
+
         for s in range(max_number_of_drops):
             delayed_channel.random_generator = np.random.default_rng(s + 10)
 
             realization = delayed_channel.realize()
-            delayed_state = realization.state(self.alpha_device, self.beta_device, 0.0, self.sampling_rate, samples_per_drop, 1).dense_state()
+            delayed_state = realization.state(self.alpha_device, self.beta_device, 0.0, self.sampling_rate, samples_per_drop, max_num_taps).dense_state()
 
-            delayed_time = np.arange(delayed_state.shape[-1]) / self.sampling_rate
-            delay_diff = (delayed_time - np.mean(delayed_time)) ** 2
             delayed_power = delayed_state.real**2 + delayed_state.imag**2
             delay_spread = np.sqrt(np.mean(delayed_power @ delay_diff) / np.mean(delayed_power))
 
@@ -537,8 +532,7 @@ class TestMultipathFadingChannel(unittest.TestCase):
         self.channel_params["gain"] = gain
         channel_gain = MultipathFadingChannel(**self.channel_params)
 
-        frame_size = (1, signal_length)
-        tx_samples = rand.normal(0, 1, frame_size) + 1j * rand.normal(0, 1, frame_size)
+        tx_samples = self.rng.standard_normal((1, signal_length, 2)).view(complex)[:, :, 0]
         tx_signal = Signal(tx_samples, self.sampling_rate)
 
         channel_no_gain.random_generator = np.random.default_rng(42)  # Reset random number rng
@@ -56,7 +56,7 @@ class TestStandardAntennaCorrelation(unittest.TestCase):
 
             covariance = self.correlation.covariance
 
-            self.assertCountEqual([num_antennas, num_antennas], covariance.shape)
+            self.assertEqual((num_antennas, num_antennas), covariance.shape)
             self.assertTrue(np.allclose(covariance, covariance.T.conj()))  # Hermitian check
 
     def test_covariance_validation(self) -> None:
@@ -74,24 +74,26 @@ class TestStandardAntennaCorrelation(unittest.TestCase):
 class TestCost259(unittest.TestCase):
     """Test the Cost256 template for the multipath fading channel model."""
 
-    def setUp(self) -> None:
-        self.alpha_device = Mock()
-        self.beta_device = Mock()
-        self.alpha_device.antennas.num_antennas = 1
-        self.beta_device.antennas.num_antennas = 1
-        self.alpha_device.position = np.array([100, 0, 0])
-        self.beta_device.position = np.array([0, 100, 0])
-        self.alpha_device.orientation = np.array([0, 0, 0])
-        self.beta_device.orientation = np.array([0, 0, pi])
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.alpha_device = Mock()
+        cls.beta_device = Mock()
+        cls.alpha_device.antennas.num_antennas = 1
+        cls.beta_device.antennas.num_antennas = 1
+        cls.alpha_device.position = np.array([100, 0, 0])
+        cls.beta_device.position = np.array([0, 100, 0])
+        cls.alpha_device.orientation = np.array([0, 0, 0])
+        cls.beta_device.orientation = np.array([0, 0, pi])
 
     def test_init(self) -> None:
         """Test the template initializations."""
 
         for model_type in Cost259Type:
-            channel = MultipathFadingCost259(model_type=model_type, alpha_device=self.alpha_device, beta_device=self.beta_device)
+            with self.subTest(model_type=model_type):
+                channel = MultipathFadingCost259(model_type=model_type, alpha_device=self.alpha_device, beta_device=self.beta_device)
 
-            self.assertIs(self.alpha_device, channel.alpha_device)
-            self.assertIs(self.beta_device, channel.beta_device)
+                self.assertIs(self.alpha_device, channel.alpha_device)
+                self.assertIs(self.beta_device, channel.beta_device)
 
     def test_init_validation(self) -> None:
         """Template initialization should raise ValueError on invalid model type."""
@@ -106,8 +108,9 @@ class TestCost259(unittest.TestCase):
         """The model type property should return"""
 
         for model_type in Cost259Type:
-            channel = MultipathFadingCost259(model_type)
-            self.assertEqual(model_type, channel.model_type)
+            with self.subTest(model_type=model_type):
+                channel = MultipathFadingCost259(model_type)
+                self.assertEqual(model_type, channel.model_type)
 
     def test_serialization(self) -> None:
         """Test YAML serialization"""
@@ -122,25 +125,27 @@ class TestCost259(unittest.TestCase):
 class Test5GTDL(unittest.TestCase):
     """Test the 5GTDL template for the multipath fading channel model."""
 
-    def setUp(self) -> None:
-        self.rms_delay = 1e-6
-        self.alpha_device = Mock()
-        self.beta_device = Mock()
-        self.alpha_device.antennas.num_antennas = 1
-        self.beta_device.antennas.num_antennas = 1
-        self.alpha_device.position = np.array([100, 0, 0])
-        self.beta_device.position = np.array([0, 100, 0])
-        self.alpha_device.orientation = np.array([0, 0, 0])
-        self.beta_device.orientation = np.array([0, 0, pi])
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.rms_delay = 1e-6
+        cls.alpha_device = Mock()
+        cls.beta_device = Mock()
+        cls.alpha_device.antennas.num_antennas = 1
+        cls.beta_device.antennas.num_antennas = 1
+        cls.alpha_device.position = np.array([100, 0, 0])
+        cls.beta_device.position = np.array([0, 100, 0])
+        cls.alpha_device.orientation = np.array([0, 0, 0])
+        cls.beta_device.orientation = np.array([0, 0, pi])
 
     def test_init(self) -> None:
         """Test the template initializations."""
 
         for model_type in TDLType:
-            channel = MultipathFading5GTDL(model_type=model_type, alpha_device=self.alpha_device, beta_device=self.beta_device)
+            with self.subTest(model_type=model_type):
+                channel = MultipathFading5GTDL(model_type=model_type, alpha_device=self.alpha_device, beta_device=self.beta_device)
 
-            self.assertIs(self.alpha_device, channel.alpha_device)
-            self.assertIs(self.beta_device, channel.beta_device)
+                self.assertIs(self.alpha_device, channel.alpha_device)
+                self.assertIs(self.beta_device, channel.beta_device)
 
     def test_init_validation(self) -> None:
         """Template initialization should raise ValueError on invalid model type."""
@@ -161,8 +166,9 @@ class Test5GTDL(unittest.TestCase):
         """The model type property should return the proper model type."""
 
         for model_type in TDLType:
-            channel = MultipathFading5GTDL(model_type=model_type)
-            self.assertEqual(model_type, channel.model_type)
+            with self.subTest(model_type=model_type):
+                channel = MultipathFading5GTDL(model_type=model_type)
+                self.assertEqual(model_type, channel.model_type)
 
     def test_serialization(self) -> None:
         """Test YAML serialization"""
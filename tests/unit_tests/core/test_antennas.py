@@ -7,7 +7,7 @@ import numpy as np
 from numpy.testing import assert_array_equal, assert_array_almost_equal
 from scipy.constants import pi, speed_of_light
 
-from hermespy.core import Antenna, AntennaArray, AntennaMode, AntennaPort, CustomAntennaArray, Dipole, Direction, LinearAntenna, IdealAntenna, PatchAntenna, UniformArray
+from hermespy.core import Antenna, AntennaArray, AntennaMode, AntennaPort, CustomAntennaArray, Dipole, Direction, LinearAntenna, IdealAntenna, PatchAntenna, Transformation, UniformArray
 from .test_factory import test_yaml_roundtrip_serialization
 
 __author__ = "Jan Adler"
@@ -603,6 +603,33 @@ class _TestAntennaArray(TestCase):
 
         assert_array_almost_equal(front_array_response, back_array_response)
 
+    def test_port_positions(self) -> None:
+        """Port positions should be reported relative to the array's global position"""
+
+        self.array.position = np.array([1.0, 2.0, 3.0])
+
+        for mode, ports in [(AntennaMode.DUPLEX, self.array.ports), (AntennaMode.TX, self.array.transmit_ports), (AntennaMode.RX, self.array.receive_ports)]:
+            expected_positions = np.array([p.global_position for p in ports]).reshape((-1, 3)) - self.array.global_position
+            positions = self.array.port_positions(mode)
+
+            assert_array_almost_equal(expected_positions, positions)
+            self.assertFalse(positions.flags.writeable)
+            self.assertIs(positions, self.array.port_positions(mode))
+
+    def test_port_positions_validation(self) -> None:
+        """Port positions should raise a ValueError on unknown antenna modes"""
+
+        with self.assertRaises(ValueError):
+            self.array.port_positions(Mock())
+
+    def test_port_positions_kinematics_update(self) -> None:
+        """Cached port positions should be discarded if the array's kinematics change"""
+
+        positions = self.array.port_positions()
+        self.array.orientation = np.array([0.0, 0.0, 0.5 * pi])
+
+        self.assertIsNot(positions, self.array.port_positions())
+
     def test_serialization(self) -> None:
         """Test YAML serialization"""
 
@@ -677,6 +704,18 @@ class TestUniformArray(_TestAntennaArray):
         with self.assertRaises(ValueError):
             self.array.dimensions = (1, 2, -1)
 
+    def test_port_positions_port_update(self) -> None:
+        """Cached port positions should be discarded if a port of the array is moved"""
+
+        port = self.array.ports[3]
+        positions = self.array.port_positions()
+
+        port.position = np.array([1.0, 2.0, 3.0])
+
+        self.assertIs(self.array, port.array)
+        self.assertIsNot(positions, self.array.port_positions())
+        assert_array_almost_equal(port.global_position - self.array.global_position, self.array.port_positions()[3, :])
+
     def test_topology(self) -> None:
         """The generated topology should be uniform"""
 
@@ -690,6 +729,13 @@ class TestUniformArray(_TestAntennaArray):
 
         assert_array_equal(expected_topology, self.array.topology)
 
+        # Multidimensional arrays should follow the ordering of an xy-indexed grid
+        self.array.dimensions = (2, 3, 2)
+        grid = np.meshgrid(np.arange(2), np.arange(3), np.arange(2))
+        expected_topology = spacing * np.vstack((grid[0].flat, grid[1].flat, grid[2].flat)).T
+
+        assert_array_almost_equal(expected_topology, self.array.topology)
+
 
 class TestCustomAntennaArray(TestCase):
     """Test the customizable antenna array model"""
@@ -711,6 +757,26 @@ class TestCustomAntennaArray(TestCase):
         self.assertIs(self.ports[0], ports[0])
         self.assertIs(self.ports[1], ports[1].antennas[0])
 
+    def test_port_positions_update(self) -> None:
+        """Cached port positions should be discarded if the array's ports change"""
+
+        positions = self.array.port_positions()
+
+        port = AntennaPort([IdealAntenna(AntennaMode.DUPLEX)], Transformation.From_Translation(np.array([1.0, 2.0, 3.0])))
+        self.array.add_port(port)
+        self.assertSequenceEqual((3, 3), self.array.port_positions().shape)
+
+        port.position = np.array([3.0, 2.0, 1.0])
+        assert_array_almost_equal(port.position, self.array.port_positions()[2, :])
+
+        self.assertSequenceEqual((2, 3), self.array.port_positions(AntennaMode.TX).shape)
+        for antenna in self.array.ports[0].antennas:
+            antenna.mode = AntennaMode.RX
+        self.assertSequenceEqual((1, 3), self.array.port_positions(AntennaMode.TX).shape)
+
+        self.array.remove_port(port)
+        assert_array_almost_equal(positions, self.array.port_positions())
+
     def test_add_port(self) -> None:
         """Adding a new port should correctly adapt the array"""
 
@@ -194,6 +194,9 @@ class TestChannelStateInformation(TestCase):
             # Assert that the slice was selected correctly
             assert_array_equal(self.csi.state[:, :, sample_idx, :], samples.state[:, :, 0, :])
 
+            # Slices should share memory with the original state
+            self.assertTrue(np.shares_memory(self.csi.state, samples.state))
+
     def test_item_getset(self) -> None:
         for rx, tx in np.ndindex(self.num_rx_streams, self.num_tx_streams):
             # Assert that the slice was selected correctly
@@ -38,6 +38,17 @@ class TestDirection(TestCase):
         assert_array_almost_equal(expected_directions, transformed_directions)
         assert_array_almost_equal(angles, transformed_angles)
 
+    def test_spherical_batch(self) -> None:
+        """Batch initialization should match the individual spherical transformation"""
+
+        angles = np.pi * np.array([[0.0, 0.0], [0.0, 1.0], [0.0, 0.5], [0.5, 0.5], [1.0, 0.5], [-0.5, 0.5], [0.25, 0.3]])
+
+        expected_directions = np.array([Direction.From_Spherical(*angle) for angle in angles])
+        batch_directions = Direction.From_Spherical_batch(angles)
+
+        self.assertSequenceEqual((angles.shape[0], 3), batch_directions.shape)
+        assert_array_almost_equal(expected_directions, batch_directions)
+
     def test_cartesian(self) -> None:
         """Test initialization from cartesian vectors"""
 
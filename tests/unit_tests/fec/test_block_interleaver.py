@@ -89,6 +89,14 @@ class TestBlockInterleaver(unittest.TestCase):
 
         np.testing.assert_array_equal(expected_code, self.interleaver.encode(bits))
 
+    def test_batch_interleaving(self) -> None:
+        """Batch interleaving must match the interleaving of individual blocks."""
+
+        bits = np.arange(3 * self.block_size).reshape((3, self.block_size))
+        code = self.interleaver.encode_blocks(bits)
+
+        np.testing.assert_array_equal(np.array([self.interleaver.encode(b) for b in bits]), code)
+
     def test_deinterleaving(self) -> None:
         """De-Interleaving must produce the expected results."""
 
@@ -81,6 +81,16 @@ class TestEncoder(TestCase):
         expected_rate = 0.5
         self.assertAlmostEqual(expected_rate, self.encoder.rate, msg="Rate produced unexpected value")
 
+    def test_encode_blocks(self) -> None:
+        """Default block batch encoding should encode each block separately"""
+
+        bits = np.random.default_rng(42).integers(0, 2, (3, self.bits_in_frame))
+        code = self.encoder.encode_blocks(bits)
+
+        self.assertSequenceEqual((3, self.encoder.code_block_size), code.shape)
+        for block_bits, block_code in zip(bits, code):
+            assert_array_equal(self.encoder.encode(block_bits), block_code)
+
 
 class TestEncoderManager(TestCase):
     """Test the `EncoderManager`, responsible for configuring arbitrary channel encodings"""
@@ -57,6 +57,14 @@ class TestRepetitionEncoder(unittest.TestCase):
 
         assert_array_equal(data, code)
 
+    def test_encode_blocks(self) -> None:
+        """Batch encoding must match the encoding of individual blocks."""
+
+        bits = self.generator.integers(0, 2, (4, self.bit_block_size))
+        code = self.encoder.encode_blocks(bits)
+
+        assert_array_equal(np.array([self.encoder.encode(b) for b in bits]), code)
+
     def test_encode_block_length(self) -> None:
         """Length of the code block after encoding must match the code block size property."""
 
@@ -76,6 +76,15 @@ class TestScrambler3GPP(unittest.TestCase):
 
         assert_array_equal(data, decoded_data)
 
+    def test_encode_blocks(self) -> None:
+        """Batch encoding should continue the scrambling sequence across blocks"""
+
+        data = np.random.randint(0, 2, (31, 1))
+        code = self.scrambler.encode_blocks(data)
+
+        expected_code = Scrambler3GPP().encode(data.flatten())
+        assert_array_equal(expected_code, code.flatten())
+
     def test_serialization(self) -> None:
         """Test YAML serialization"""
 
@@ -7,9 +7,9 @@ from unittest.mock import patch, PropertyMock
 
 import numpy as np
 from h5py import File
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 
-from hermespy.core import Signal
+from hermespy.core import Precision, Signal
 from hermespy.modem import CommunicationReception, CommunicationTransmission, DuplexModem, Symbols, CommunicationWaveform
 from hermespy.radar import Radar, RadarCube, RadarReception
 from hermespy.simulation import SimulatedDevice
@@ -114,8 +114,57 @@ class TestMatchedFilterJoint(TestCase):
         reception = self.joint.receive()
         self.assertTrue(10, reception.cube.data.argmax)
 
+        num_transmitted_samples = transmission.signal.num_samples
         padded_reception = self.joint.receive(transmission.signal)
         self.assertTrue(10, padded_reception.cube.data.argmax)
+        self.assertEqual(num_transmitted_samples, transmission.signal.num_samples)
+
+    def test_matched_filter_spectrum(self) -> None:
+        """The matched filter spectrum should be cached per transmission and transform length"""
+
+        transmission = self.joint.transmit()
+        spectrum = self.joint._matched_filter_spectrum(64)
+
+        assert_array_almost_equal(np.conj(np.fft.fft(transmission.signal.samples, 64, axis=1)), spectrum)
+        self.assertIs(spectrum, self.joint._matched_filter_spectrum(64))
+        self.assertEqual(128, self.joint._matched_filter_spectrum(128).shape[1])
+
+        _ = self.joint.transmit()
+        self.assertIsNot(spectrum, self.joint._matched_filter_spectrum(64))
+
+    def test_range_bins(self) -> None:
+        """Range bins should be cached between receptions of identical dimensions"""
+
+        transmission = self.joint.transmit()
+        first_reception = self.joint.receive(transmission.signal)
+        second_reception = self.joint.receive(transmission.signal)
+
+        num_bins = first_reception.cube.data.shape[2]
+        assert_array_almost_equal(0.5 * np.arange(num_bins) * self.joint.range_resolution, first_reception.cube.range_bins)
+        self.assertIs(first_reception.cube.range_bins, second_reception.cube.range_bins)
+
+        self.joint.max_range = 20
+        third_reception = self.joint.receive(transmission.signal)
+        self.assertEqual(third_reception.cube.data.shape[2], len(third_reception.cube.range_bins))
+        self.assertGreater(len(third_reception.cube.range_bins), num_bins)
+
+    def test_precision_setget(self) -> None:
+        """Precision property getter should return setter argument"""
+
+        self.joint.precision = Precision.SINGLE
+        self.assertIs(Precision.SINGLE, self.joint.precision)
+
+    def test_single_precision_receive(self) -> None:
+        """Single precision correlations should approximate double precision correlations"""
+
+        transmission = self.joint.transmit()
+        expected_reception = self.joint.receive(transmission.signal)
+
+        self.joint.precision = Precision.SINGLE
+        reception = self.joint.receive(transmission.signal)
+
+        self.assertEqual(np.complex64, self.joint._matched_filter_spectrum(64).dtype)
+        assert_array_almost_equal(expected_reception.cube.data, reception.cube.data, decimal=5)
 
     def test_range_resolution_setget(self) -> None:
         """Range resolution property getter should return setter argument."""
@@ -84,6 +84,24 @@ class TestSymbolPrecoding(unittest.TestCase):
 
         self.assertEqual(10, self.precoding.num_encoded_blocks(5))
 
+        precoder_beta = Mock()
+        precoder_beta.rate = Fraction(3, 4)
+        self.precoding[1] = precoder_beta
+
+        self.assertEqual(13, self.precoding.num_encoded_blocks(5))
+
+        # Plain integer and float rates should be supported as well
+        precoder_alpha.rate = 2
+        precoder_beta.rate = 0.5
+
+        self.assertEqual(5, self.precoding.num_encoded_blocks(5))
+
+        # Float rates without an exact binary representation should not undercount blocks
+        precoder_alpha.rate = 1
+        precoder_beta.rate = 0.1
+
+        self.assertEqual(30, self.precoding.num_encoded_blocks(3))
+
     def test_serialization(self) -> None:
         """Test YAML serialization"""
 
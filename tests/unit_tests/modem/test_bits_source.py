@@ -44,10 +44,20 @@ class TestRandomBitsSource(TestCase):
             # Assert that the requested number of bits is returned
             self.assertEqual(bits.ndim, 1)
             self.assertEqual(bits.shape[0], number_of_bits)
+            self.assertEqual(np.uint8, bits.dtype)
 
             # Assert that all bits are actually either zeros or ones
             self.assertEqual(True, np.any((bits == 1) | (bits == 0)))
 
+    def test_get_bits_partial_byte(self) -> None:
+        """Bit generation should support numbers of bits not divisible by eight"""
+
+        for number_of_bits in (0, 1, 7, 9):
+            bits = self.source.generate_bits(number_of_bits)
+
+            self.assertEqual(number_of_bits, len(bits))
+            self.assertTrue(np.all((bits == 1) | (bits == 0)))
+
 
 class TestStreamBitsSource(TestCase):
     """Test bits source that reads bits from a file stream"""
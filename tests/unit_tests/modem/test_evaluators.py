@@ -74,6 +74,11 @@ class TestBitErrorEvaluation(TestCase):
 
         self.assertEqual("Bit Error Evaluation", self.evaluation.title)
 
+    def test_artifact(self) -> None:
+        """Artifact should represent the bit error rate"""
+
+        self.assertAlmostEqual(np.mean(self.evaluation.evaluation), self.evaluation.artifact().to_scalar())
+
     def test_plot(self) -> None:
         """Plotting should generate a valid plot"""
 
@@ -109,6 +114,34 @@ class TestBitErrorEvaluator(TestCase):
         evaluation = self.evaluator.evaluate()
         self.assertEqual(0.0, evaluation.artifact().to_scalar())
 
+    def test_evaluate_mismatching_stream_lengths(self) -> None:
+        """Evaluator should compare zero-padded bit streams of mismatching lengths"""
+
+        self.transmitter._Transmitter__transmission = Mock()
+        self.transmitter.transmission.bits = np.array([1, 0, 1, 1])
+        self.receiver._Receiver__reception = Mock()
+        self.receiver.reception.bits = np.array([1, 1])
+
+        evaluation = self.evaluator.evaluate()
+        np.testing.assert_array_equal(np.array([0, 1, 1, 1]), evaluation.evaluation)
+
+    def test_evaluate_empty_stream(self) -> None:
+        """Evaluator should compare against zeros if either bit stream is empty"""
+
+        self.transmitter._Transmitter__transmission = Mock()
+        self.transmitter.transmission.bits = np.array([1, 0, 1, 1])
+        self.receiver._Receiver__reception = Mock()
+        self.receiver.reception.bits = np.empty(0, dtype=np.int_)
+
+        evaluation = self.evaluator.evaluate()
+        np.testing.assert_array_equal(np.array([1, 0, 1, 1]), evaluation.evaluation)
+
+        self.transmitter.transmission.bits = np.empty(0, dtype=np.int_)
+        self.receiver.reception.bits = np.array([0, 1])
+
+        evaluation = self.evaluator.evaluate()
+        np.testing.assert_array_equal(np.array([0, 1]), evaluation.evaluation)
+
     def test_abbreviation(self) -> None:
         """Abbreviation should be properly generated"""
 
@@ -186,6 +219,20 @@ class TestBlockErrorEvaluator(TestCase):
         evaluation = self.evaluator.evaluate()
         self.assertLess(0, evaluation.artifact().to_scalar())
 
+    def test_evaluate_empty_transmission(self) -> None:
+        """Evaluator should assume block errors for all blocks if no bits were transmitted"""
+
+        transmission = self.transmitter.transmit()
+        reception = self.receiver.receive(transmission.signal)
+        block_size = self.receiver.encoder_manager.bit_block_size
+
+        self.transmitter._Transmitter__transmission = Mock()
+        self.transmitter.transmission.bits = np.empty(0, dtype=np.int_)
+
+        evaluation = self.evaluator.evaluate()
+        self.assertEqual(-(-len(reception.bits) // block_size), len(evaluation.evaluation))
+        self.assertEqual(1.0, evaluation.artifact().to_scalar())
+
     def test_abbreviation(self) -> None:
         """Abbreviation should be properly generated"""
 
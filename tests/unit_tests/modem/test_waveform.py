@@ -232,6 +232,42 @@ class TestZeroForcingEqualization(unittest.TestCase):
         equalized_symbols = self.equalization.equalize_channel(propagated_symbols)
         assert_array_almost_equal(self.symbols.raw, equalized_symbols.raw)
 
+    def test_mimo_equalization(self) -> None:
+        """Test ZF equalization in the MIMO case"""
+
+        transmitted_symbols = np.repeat(self.raw_symbols.raw, 2, axis=0)
+        state_dimensions = (3, 2, self.raw_symbols.num_blocks, self.raw_symbols.num_symbols)
+        self.raw_state = self.rng.normal(size=state_dimensions) + 1j * self.rng.normal(size=state_dimensions)
+        propagated_symbols = StatedSymbols(np.einsum("ijkl,jkl->ikl", self.raw_state, transmitted_symbols), self.raw_state)
+
+        equalized_symbols = self.equalization.equalize_channel(propagated_symbols)
+        assert_array_almost_equal(transmitted_symbols, equalized_symbols.raw)
+
+    def test_rank_deficient_mimo_equalization(self) -> None:
+        """ZF equalization should fall back to the pseudo-inverse for rank-deficient channel states"""
+
+        self.raw_state = np.ones((2, 2, self.raw_symbols.num_blocks, self.raw_symbols.num_symbols))
+        propagated_symbols = StatedSymbols(np.repeat(self.raw_symbols.raw, 2, axis=0), self.raw_state)
+
+        equalized_symbols = self.equalization.equalize_channel(propagated_symbols)
+        assert_array_almost_equal(np.repeat(0.5 * self.raw_symbols.raw, 2, axis=0), equalized_symbols.raw)
+
+    def test_ill_conditioned_mimo_equalization(self) -> None:
+        """ZF equalization should remain accurate for ill-conditioned but regular channel states"""
+
+        transmitted_symbols = np.repeat(self.raw_symbols.raw, 2, axis=0).astype(complex)
+        transmitted_symbols[1, ...] *= 1j
+
+        for num_streams in (2, 3):
+            # Nearly collinear channel states with a condition number in the order of 1e7
+            state = np.ones((num_streams, 2), dtype=complex)
+            state[1:, 1] += 1e-7
+            self.raw_state = np.tile(state[:, :, None, None], (1, 1, self.raw_symbols.num_blocks, self.raw_symbols.num_symbols))
+            propagated_symbols = StatedSymbols(np.einsum("ijkl,jkl->ikl", self.raw_state, transmitted_symbols), self.raw_state)
+
+            equalized_symbols = self.equalization.equalize_channel(propagated_symbols)
+            assert_array_almost_equal(transmitted_symbols, equalized_symbols.raw, decimal=6)
+
 
 class TestCommunicationWaveform(unittest.TestCase):
     """Test the communication waveform generator unit"""
@@ -247,6 +283,35 @@ class TestCommunicationWaveform(unittest.TestCase):
 
         self.assertIs(self.modem, self.waveform.modem)
 
+    def test_default_routines(self) -> None:
+        """Default processing routines should be created on first access and bound to the waveform"""
+
+        synchronization = self.waveform.synchronization
+        channel_estimation = self.waveform.channel_estimation
+        channel_equalization = self.waveform.channel_equalization
+
+        self.assertIs(synchronization, self.waveform.synchronization)
+        self.assertIs(channel_estimation, self.waveform.channel_estimation)
+        self.assertIs(channel_equalization, self.waveform.channel_equalization)
+        self.assertIs(self.waveform, synchronization.waveform)
+        self.assertIs(self.waveform, channel_estimation.waveform)
+        self.assertIs(self.waveform, channel_equalization.waveform)
+
+    def test_routine_reassignment(self) -> None:
+        """Reassigning routines to another waveform should restore the defaults of the previous waveform"""
+
+        synchronization = Synchronization()
+        self.waveform.synchronization = synchronization
+
+        other_waveform = MockCommunicationWaveform()
+        synchronization.waveform = other_waveform
+
+        self.assertIsNot(synchronization, self.waveform.synchronization)
+        self.assertIs(self.waveform, self.waveform.synchronization.waveform)
+
+        self.waveform.synchronization = None
+        self.assertIs(self.waveform, self.waveform.synchronization.waveform)
+
     def test_oversampling_factor_validation(self) -> None:
         """Oversampling factor property setter should raise a ValueError on invalid arguments"""
 
@@ -291,8 +356,11 @@ class TestCommunicationWaveform(unittest.TestCase):
         num_samples_test = [50, 100, 150, 200]
         expected_num_frames_candidates = [0, 1, 1, 1]
 
+        # Generate a single signal covering the longest test case and slice it for shorter ones
+        full_signal = np.exp(2j * self.rnd.uniform(0, pi, (num_streams, 1))) * np.exp(2j * self.rnd.uniform(0, pi, (1, max(num_samples_test))))
+
         for num_samples, expected_num_frames in zip(num_samples_test, expected_num_frames_candidates):
-            signal = np.exp(2j * self.rnd.uniform(0, pi, (num_streams, 1))) @ np.exp(2j * self.rnd.uniform(0, pi, (1, num_samples)))
+            signal = full_signal[:, :num_samples]
 
             synchronized_frames = self.waveform.synchronization.synchronize(signal)
 
@@ -346,6 +414,23 @@ class TestCommunicationWaveform(unittest.TestCase):
 
         self.assertTrue(self.waveform.symbol_precoding_support)
 
+    def test_modulate_demodulate_batch(self) -> None:
+        """Batch modulation and demodulation should match stream-wise processing"""
+
+        symbols_batch = [Symbols(self.rnd.standard_normal((1, self.waveform.symbols_per_frame, 1)) + 0j) for _ in range(3)]
+
+        frame_samples = self.waveform.modulate_batch(symbols_batch)
+        self.assertEqual((3, self.waveform.samples_per_frame), frame_samples.shape)
+
+        for symbols, samples in zip(symbols_batch, frame_samples):
+            assert_array_equal(self.waveform.modulate(symbols), samples)
+
+        demodulated_symbols = self.waveform.demodulate_batch(frame_samples)
+        self.assertEqual(3, demodulated_symbols.num_streams)
+
+        for s, symbols in enumerate(symbols_batch):
+            assert_array_equal(symbols.raw[0, :, :], demodulated_symbols.raw[s, :, :])
+
 
 class TestUniformPilotSymbolSequence(unittest.TestCase):
     """Test the uniform pilot symbol sequence"""
@@ -357,6 +442,8 @@ class TestUniformPilotSymbolSequence(unittest.TestCase):
         uniform_sequence = UniformPilotSymbolSequence(expected_symbol)
 
         assert_array_equal(np.array([expected_symbol], dtype=complex), uniform_sequence.sequence)
+        self.assertIs(uniform_sequence.sequence, uniform_sequence.sequence)
+        self.assertFalse(uniform_sequence.sequence.flags.writeable)
 
 
 class TestConfigurablePilotWaveform(unittest.TestCase):
@@ -382,3 +469,11 @@ class TestConfigurablePilotWaveform(unittest.TestCase):
 
         symbols = self.waveform.pilot_symbols(3)
         assert_array_equal(self.pilot_symbols, symbols)
+
+        repeated_symbols = self.waveform.pilot_symbols(8)
+        assert_array_equal(np.tile(self.pilot_symbols, 3)[:8], repeated_symbols)
+
+        # Repeated sequences should be reused for identical requests
+        self.assertIs(repeated_symbols, self.waveform.pilot_symbols(8))
+        self.assertIsNot(repeated_symbols, self.waveform.pilot_symbols(7))
+        assert_array_equal(np.tile(self.pilot_symbols, 3)[:7], self.waveform.pilot_symbols(7))
@@ -423,6 +423,19 @@ class TestChannelEqualization(TestCase):
 
         assert_array_almost_equal(self.symbols.raw, equalized_symbols.raw)
 
+    def test_mmse_mimo(self) -> None:
+        """Test MMSE equalization in the MIMO case"""
+
+        transmitted_symbols = np.repeat(self.raw_symbols.raw, 2, axis=0)
+        num_blocks, num_symbols = transmitted_symbols.shape[1:]
+        self.raw_state = self.rng.normal(size=(2, 2, num_blocks, num_symbols)) + 1j * self.rng.normal(size=(2, 2, num_blocks, num_symbols))
+        propagated_symbols = StatedSymbols(np.einsum("ijkl,jkl->ikl", self.raw_state, transmitted_symbols), self.raw_state)
+
+        equalization = SingleCarrierMinimumMeanSquareChannelEqualization(self.waveform)
+        equalized_symbols = equalization.equalize_channel(propagated_symbols)
+
+        assert_array_almost_equal(transmitted_symbols, equalized_symbols.raw)
+
 
 class TestRolledOfFilteredSingleCarrierWaveform(TestCase):
     """Test the rolled-off filtered single carrier waveform generator"""
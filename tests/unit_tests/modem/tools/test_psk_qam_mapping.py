@@ -143,6 +143,20 @@ class TestPskQamMapping(unittest.TestCase):
 
         np.testing.assert_array_almost_equal(qam256_symbols, symbols)
 
+    def test_symbols_unsigned_bits(self) -> None:
+        """Unsigned integer bits should map to the same symbols as signed bits"""
+
+        bits = np.array([0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 1, 1, 0, 1, 0, 0, 0, 1, 0, 1, 0, 1, 1, 0, 0, 1, 1, 1, 1, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1])
+
+        for modulation_order, is_complex in [(2, True), (4, True), (4, False), (8, False), (16, True), (16, False), (64, True), (256, True)]:
+            psk_qam_mapping = PskQamMapping(modulation_order, is_complex=is_complex)
+            num_bits = bits.size - bits.size % psk_qam_mapping.bits_per_symbol
+
+            expected_symbols = psk_qam_mapping.get_symbols(bits[:num_bits])
+            symbols = psk_qam_mapping.get_symbols(bits[:num_bits].astype(np.uint8))
+
+            np.testing.assert_array_almost_equal(expected_symbols, symbols)
+
     def test_demodulation_validation(self) -> None:
         """Demodulating symbols should raise RuntimeError for invalid internal states"""
 
@@ -198,6 +212,17 @@ class TestPskQamMapping(unittest.TestCase):
 
         np.testing.assert_array_equal(bits == 1, rx_bits)
 
+    def test_soft_demodulation_scalar_noise_variance(self) -> None:
+        """Scalar noise variances should be applied to all symbols"""
+
+        psk_qam_mapping = PskQamMapping(16, soft_output=True)
+        symbols = psk_qam_mapping.get_symbols(np.random.randint(2, size=40))
+
+        expected_llrs = psk_qam_mapping.detect_bits(symbols, 0.5 * np.ones(symbols.shape))
+        llrs = psk_qam_mapping.detect_bits(symbols, 0.5)
+
+        np.testing.assert_array_almost_equal(expected_llrs, llrs)
+
     def test_demodulation_custom_mapping_validation(self) -> None:
         """Demodulating a custom mapping with soft output should raise ValueError"""
 
@@ -283,7 +283,7 @@ class TestReciverOperatingCharacteristics(TestCase):
         """Test evaluation extraction"""
 
         evaluation = self._generate_evaluation()
-        self.assertCountEqual(evaluation.data_h0.shape, evaluation.data_h1.shape)
+        self.assertEqual(evaluation.data_h0.shape, evaluation.data_h1.shape)
 
     def test_generate_result_empty_grid(self) -> None:
         """Test result generation over an empty grid"""
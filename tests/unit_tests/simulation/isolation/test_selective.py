@@ -43,6 +43,26 @@ class TestSelectiveLeakage(TestCase):
         self.assertSequenceEqual((6, 6, 10), leakage_response.shape)
         assert_array_almost_equal(np.ones(leakage_response.shape), np.abs(leakage_selectivity))
 
+    def test_device_random_mother(self) -> None:
+        """The leakage model's random mother should be its device"""
+
+        self.assertIs(self.device, self.leakage.random_mother)
+
+        self.leakage.device = None
+        self.assertIsNone(self.leakage.random_mother)
+        self.assertTrue(self.leakage.is_random_root)
+
+    def test_normal_reproducibility(self) -> None:
+        """Normal leakage models should be reproducible given identical device seeds"""
+
+        self.device.seed = 42
+        first_leakage = SelectiveLeakage.Normal(self.device, num_samples=10)
+
+        self.device.seed = 42
+        second_leakage = SelectiveLeakage.Normal(self.device, num_samples=10)
+
+        assert_array_almost_equal(first_leakage.leakage_response, second_leakage.leakage_response)
+
     def test_leak(self) -> None:
         """Leaking a signal should result in the expected leak"""
 
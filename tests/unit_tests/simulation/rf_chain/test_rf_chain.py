@@ -69,6 +69,36 @@ class TestRfChain(TestCase):
 
         self.assertIs(expected_noise, self.rf_chain.phase_noise)
 
+    def test_transmit_receive_signal_properties(self) -> None:
+        """Transmission and reception should preserve signal properties without modifying the input"""
+
+        signal = Signal.empty(1.0, 1, 10, carrier_frequency=2.0, delay=3.0)
+        signal.samples[:] = 1.0 + 1.0j
+        self.rf_chain.amplitude_imbalance = 0.1
+        self.rf_chain.phase_offset = 0.2
+
+        for processed_signal in (self.rf_chain.transmit(signal), self.rf_chain.receive(signal)):
+            self.assertEqual(signal.sampling_rate, processed_signal.sampling_rate)
+            self.assertEqual(signal.carrier_frequency, processed_signal.carrier_frequency)
+            self.assertEqual(signal.delay, processed_signal.delay)
+            self.assertEqual(signal.num_samples, processed_signal.num_samples)
+            self.assertIsNot(signal.samples, processed_signal.samples)
+
+        self.assertTrue((signal.samples == 1.0 + 1.0j).all())
+
+    def test_disabled_phase_noise(self) -> None:
+        """Disabled phase noise models should be skipped during transmission and reception"""
+
+        phase_noise = Mock()
+        phase_noise.enabled = False
+        self.rf_chain.phase_noise = phase_noise
+
+        signal = Signal.empty(1.0, 1, 10, carrier_frequency=0.0)
+        self.rf_chain.transmit(signal)
+        self.rf_chain.receive(signal)
+
+        phase_noise.add_noise.assert_not_called()
+
     def test_transmit_power_amplifier_integration(self) -> None:
         """Power amplifier should be called during transmit"""
 
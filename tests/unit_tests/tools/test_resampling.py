@@ -55,4 +55,4 @@ class TestDelayResampling(TestCase):
 
         for num_input_samples, num_output_samples in product(num_input_samples_tests, num_output_samples_tests):
             resampling_matrix = delay_resampling_matrix(sampling_rate, num_input_samples, delay, num_output_samples)
-            self.assertCountEqual([num_output_samples, num_input_samples], resampling_matrix.shape)
+            self.assertEqual((num_output_samples, num_input_samples), resampling_matrix.shape)